@@ -6,13 +6,21 @@
 
 import json
 import logging
+import queue
 import threading
 import time
 import serial
 import serial.tools.list_ports
+from collections import deque
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Deque, Dict, Any, Optional, List, Tuple
 from app.core.interface.icell import ICell
 from app.core.di.container import injected, AutoInjectMeta
 from app.core.bus.event_bus import event_bus, EventBus
@@ -20,33 +28,96 @@ from app.core.bus.event_bus import event_bus, EventBus
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """JSON 序列化（优先 orjson，缺失时回退标准库）"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """JSON 序列化为 UTF-8 字节（SSE 推送路径，避免额外 encode）"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _dumps(obj).encode('utf-8')
+
+
+# 固定内容的响应只序列化一次，热路径直接返回常量
+_PING_OK = _dumps({"status": "success", "message": "pong"})
+_ERR_PORT_NOT_OPEN = _dumps({"status": "error", "message": "串口未打开"})
+
+# SSE 帧定界常量，推送路径全程停留在 bytes 域
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# 短字符串编码缓存：轮询式重复发送同一命令时免去重复 encode
+_encode_cached = lru_cache(maxsize=256)(str.encode)
+
+# HEX 输入的空白剥离表：一趟 C 级 translate 去掉空格/制表符/换行
+_HEX_STRIP = str.maketrans('', '', ' \t\r\n')
+
+
+def _encode_receive_payload(elapsed_ms: int, data_str: str, hex_str: str) -> bytes:
+    """SSE 推送载荷的专用编码器
+
+    推送结构固定为 {type, elapsed_ms, data_str, hex}，骨架直接写死在模板里；
+    hex 来自 bytes.hex()，必为 ASCII 无需转义，只有 data_str 走通用 JSON 转义
+    """
+    return b'{"type":"receive","elapsed_ms":%d,"data_str":%s,"hex":"%s"}' % (
+        elapsed_ms,
+        _dumps_bytes(data_str),
+        hex_str.encode('ascii'),
+    )
+
+
 class SSEServer:
     """SSE服务器"""
     
     def __init__(self, host: str = 'localhost', port: int = 8080):
         self.host = host
         self.port = port
-        self.clients: List = []
+        self.clients: set = set()
         self.lock = threading.Lock()
         self.server: Optional[HTTPServer] = None
         self.thread: Optional[threading.Thread] = None
         self.running = False
-        
+        self._shutdown_event = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
     def start(self):
         """启动SSE服务器"""
         if self.running:
             return
-            
+
         self.running = True
+        self._shutdown_event.clear()
         self.server = SSEServerThreaded(self.host, self.port, self)
         self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
         self.thread.start()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
+        self._heartbeat_thread.start()
         logger.info(f"SSE服务器已启动: http://{self.host}:{self.port}/serial_stream")
+
+    def _heartbeat_loop(self, interval: float = 10.0):
+        """单线程心跳：统一向所有客户端发送，不再每连接各睡各的"""
+        while not self._shutdown_event.wait(interval):
+            with self.lock:
+                current_clients = tuple(self.clients)
+            for client in current_clients:
+                try:
+                    client.connection.sendall(b': heartbeat\n\n')
+                except Exception:
+                    self.remove_client(client)
         
     def stop(self):
         """停止SSE服务器"""
         self.running = False
+        self._shutdown_event.set()  # 立即唤醒所有心跳等待，无需等满一个周期
         if self.server:
+            try:
+                self.server.shutdown()
+            except Exception as e:
+                logger.debug(f"停止服务器失败: {e}")
             try:
                 self.server.socket.close()
             except Exception as e:
@@ -56,31 +127,29 @@ class SSEServer:
     def add_client(self, client_handler):
         """添加SSE客户端"""
         with self.lock:
-            if client_handler not in self.clients:
-                self.clients.append(client_handler)
-        
+            self.clients.add(client_handler)
+
     def remove_client(self, client_handler):
         """移除SSE客户端"""
         with self.lock:
-            if client_handler in self.clients:
-                self.clients.remove(client_handler)
+            self.clients.discard(client_handler)
         
     def broadcast(self, data: dict):
         """广播数据到所有客户端"""
+        self.broadcast_raw(_SSE_PREFIX + _dumps_bytes(data) + _SSE_SUFFIX)
+
+    def broadcast_raw(self, message_bytes: bytes):
+        """广播已组装好的SSE帧（允许多帧拼接，一次写出）"""
         if not self.clients:
             return
-            
-        message = f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
-        message_bytes = message.encode('utf-8')
-        
+
         with self.lock:
-            current_clients = list(self.clients)
+            current_clients = tuple(self.clients)
         
         for client in current_clients:
             try:
-                if client and client.wfile:
-                    client.wfile.write(message_bytes)
-                    client.wfile.flush()
+                # 直接走底层 socket，跳过 wfile 的缓冲层与 flush
+                client.connection.sendall(message_bytes)
             except Exception:
                 try:
                     self.remove_client(client)
@@ -132,17 +201,16 @@ class SSERequestHandler(BaseHTTPRequestHandler):
         
         sse_server = self.server.sse_server
         sse_server.add_client(self)
-        
-        heartbeat_interval = 10
-        
+
         try:
+            # 心跳由服务器的统一心跳线程发送；本线程只维持连接存活，
+            # 发送失败时由心跳/广播线程将客户端摘除
             while sse_server.running:
-                try:
-                    self.wfile.write(b': heartbeat\n\n')
-                    self.wfile.flush()
-                except (BrokenPipeError, ConnectionResetError, OSError):
+                if sse_server._shutdown_event.wait(1.0):
                     break
-                time.sleep(heartbeat_interval)
+                with sse_server.lock:
+                    if self not in sse_server.clients:
+                        break
         except Exception as e:
             logger.debug(f"SSE连接维护异常: {e}")
         finally:
@@ -170,6 +238,9 @@ def get_sse_server() -> 'SSEServer':
     return _sse_server_instance
 
 
+_BUFFER_MAXLEN = 65536
+_RAW_MAXLEN = 4 * 1024 * 1024
+
 BYTESIZE_MAP = {5: serial.FIVEBITS, 6: serial.SIXBITS, 7: serial.SEVENBITS, 8: serial.EIGHTBITS}
 PARITY_MAP = {'N': serial.PARITY_NONE, 'O': serial.PARITY_ODD, 'E': serial.PARITY_EVEN, 'M': serial.PARITY_MARK, 'S': serial.PARITY_SPACE}
 STOPBITS_MAP = {1: serial.STOPBITS_ONE, 1.5: serial.STOPBITS_ONE_POINT_FIVE, 2: serial.STOPBITS_TWO}
@@ -192,61 +263,49 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
     def cell_name(self) -> str:
         return "serial_assistant"
 
+    # 无参命令 → 方法名映射，O(1) 分发；需要解包参数的命令保留专用分支
+    _DISPATCH = {
+        "list_ports": "_list_ports",
+        "close": "_close_port",
+        "get_status": "_get_status",
+        "receive": "_receive_data",
+        "receive_hex": "_receive_hex",
+        "start_sse": "_start_sse",
+        "stop_sse": "_stop_sse",
+        "get_sse_url": "_get_sse_url",
+        "ping": "_ping",
+        "remove_sse_client": "_remove_sse_client",
+    }
+
     def execute(self, command: str, *args, **kwargs) -> str:
         """命令分发"""
         try:
-            if command == "list_ports":
-                return self._list_ports()
+            method_name = self._DISPATCH.get(command)
+            if method_name is not None:
+                return getattr(self, method_name)()
 
-            elif command == "open":
+            if command == "open":
                 params = args[0] if args else {}
                 if isinstance(params, dict):
                     return self._open_port(**params)
                 return self._open_port()
 
-            elif command == "close":
-                return self._close_port()
-
-            elif command == "send":
+            if command == "send":
                 data = args[0] if args else ''
                 if isinstance(data, dict):
                     data = data.get('data', '')
                 return self._send_data(data)
 
-            elif command == "send_hex":
+            if command == "send_hex":
                 hex_data = args[0] if args else ''
                 if isinstance(hex_data, dict):
                     hex_data = hex_data.get('hex', '')
                 return self._send_hex(hex_data)
 
-            elif command == "get_status":
-                return self._get_status()
-            
-            elif command == "receive":
-                return self._receive_data()
-            
-            elif command == "receive_hex":
-                return self._receive_hex()
-
-            elif command == "start_sse":
-                return self._start_sse()
-            
-            elif command == "stop_sse":
-                return self._stop_sse()
-            
-            elif command == "get_sse_url":
-                return self._get_sse_url()
-            
-            elif command == "ping":
-                return self._ping()
-            
-            elif command == "remove_sse_client":
-                return self._remove_sse_client()
-
-            return json.dumps({"status": "error", "message": f"Unknown command: {command}"}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": f"Unknown command: {command}"})
         except Exception as e:
             logger.error(f"串口命令执行失败: {e}")
-            return json.dumps({"status": "error", "message": str(e)}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": str(e)})
 
     def get_commands(self) -> dict:
         return {
@@ -267,16 +326,35 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
         self._serial_port: Optional[serial.Serial] = None
         self._read_thread: Optional[threading.Thread] = None
         self._running = False
-        self._received_data: List[Tuple[float, str]] = []
-        self._received_hex: List[Tuple[float, str]] = []
-        self._sent_data: List[Tuple[float, str]] = []
+        # 有界环形缓冲：无客户端消费时自动淘汰最旧数据，内存恒定
+        self._received_data: Deque[Tuple[float, str]] = deque(maxlen=_BUFFER_MAXLEN)
+        self._received_hex: Deque[Tuple[float, str]] = deque(maxlen=_BUFFER_MAXLEN)
+        self._sent_data: Deque[Tuple[float, str]] = deque(maxlen=_BUFFER_MAXLEN)
+        # 原始字节累积区，供全量取回接口使用（超限时从头部截断）
+        self._received_raw = bytearray()
+        self._sent_raw = bytearray()
         self._lock = threading.Lock()
         self._current_params: Dict[str, Any] = {}
-        self._start_time: float = time.perf_counter()
+        self._start_time: int = time.perf_counter_ns()
         self._sse_enabled = False
+        self._sse_queue: Optional[queue.Queue] = None
+        self._sse_thread: Optional[threading.Thread] = None
+        self._ports_cache: Tuple[float, str] = (0.0, "")
+        # 单调递增计数器：deque 淘汰旧数据后 len() 不再反映总量
+        self._recv_count = 0
+        self._sent_count = 0
+
+    def _list_ports(self, force: bool = False) -> str:
+        """获取可用串口列表
+
+        comports() 在 Windows 上是 WMI 查询，耗时可达数百毫秒，
+        结果缓存 1 秒；force=True 跳过缓存（热插拔场景）
+        """
+        now = time.monotonic()
+        cached_at, cached = self._ports_cache
+        if not force and cached and now - cached_at < 1.0:
+            return cached
 
-    def _list_ports(self) -> str:
-        """获取可用串口列表"""
         ports = serial.tools.list_ports.comports()
         port_list = []
         for port in ports:
@@ -286,7 +364,9 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
                 "hwid": port.hwid
             })
         logger.info(f"发现 {len(port_list)} 个串口")
-        return json.dumps({"status": "success", "ports": port_list}, ensure_ascii=False)
+        result = _dumps({"status": "success", "ports": port_list})
+        self._ports_cache = (now, result)
+        return result
 
     def _open_port(self, port: str = '', baudrate: int = 9600, bytesize: int = 8,
                    parity: Optional[str] = None, stopbits: float = 1,
@@ -296,7 +376,7 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
             self._close_port()
 
         if not port:
-            return json.dumps({"status": "error", "message": "未指定串口号"}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": "未指定串口号"})
 
         try:
             serial_bytesize = BYTESIZE_MAP.get(bytesize, serial.EIGHTBITS)
@@ -315,6 +395,13 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
                 xonxoff=xonxoff
             )
 
+            # Windows 下增大驱动接收缓冲区，降低高波特率时的读线程唤醒频率
+            if hasattr(self._serial_port, 'set_buffer_size'):
+                try:
+                    self._serial_port.set_buffer_size(rx_size=65536, tx_size=4096)
+                except Exception as e:
+                    logger.debug(f"设置串口缓冲区大小失败: {e}")
+
             self._current_params = {
                 'port': port,
                 'baudrate': baudrate,
@@ -331,7 +418,7 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
             logger.info(f"串口已打开: {port}, 波特率: {baudrate}, 数据位: {bytesize}, 校验: {parity}, 停止位: {stopbits}")
             event_bus.publish("serial.opened", **self._current_params)
 
-            return json.dumps({
+            return _dumps({
                 "status": "success",
                 "message": f"串口已打开: {port}",
                 "port": port,
@@ -339,11 +426,11 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
                 "bytesize": bytesize,
                 "parity": parity,
                 "stopbits": stopbits
-            }, ensure_ascii=False)
+            })
         except Exception as e:
             error_msg = f"打开串口失败: {e}"
             logger.error(error_msg)
-            return json.dumps({"status": "error", "message": error_msg}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": error_msg})
 
     def _close_port(self) -> str:
         """关闭串口"""
@@ -359,7 +446,7 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
         logger.info("串口已关闭")
         event_bus.publish("serial.closed")
 
-        return json.dumps({"status": "success", "message": "串口已关闭"}, ensure_ascii=False)
+        return _dumps({"status": "success", "message": "串口已关闭"})
 
     def _start_read_thread(self):
         """启动数据读取线程"""
@@ -368,194 +455,282 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
 
     def _read_data(self):
         """后台读取串口数据"""
-        while self._running and self._serial_port and self._serial_port.is_open:
+        # 热路径本地绑定，省去循环内的全局/属性查找；
+        # _received_data/_sse_queue 可能被消费端整体换出，必须每次经 self 读取
+        serial_port = self._serial_port
+        perf_counter = time.perf_counter_ns
+        start = self._start_time
+
+        while self._running and serial_port.is_open:
             try:
-                if self._serial_port.in_waiting > 0:
-                    timestamp = time.perf_counter()
-                    data = self._serial_port.read(self._serial_port.in_waiting)
-                    elapsed_ms = (timestamp - self._start_time) * 1000
+                # 阻塞式读取：无数据时在驱动里休眠（受 timeout=0.1s 限制），
+                # 有数据时一次带回缓冲区的全部内容
+                data = serial_port.read(serial_port.in_waiting or 1)
+                if data:
+                    timestamp = perf_counter()
+                    elapsed_ms = (timestamp - start) // 1_000_000
                     
                     data_str = data.decode('utf-8', errors='replace')
-                    hex_str = ' '.join(f'{b:02X}' for b in data)
+                    hex_str = data.hex(' ').upper()
                     
-                    with self._lock:
-                        self._received_data.append((timestamp, data_str))
-                        self._received_hex.append((timestamp, hex_str))
+                    # 单生产者路径：deque.append 在 GIL 下是原子的，无需持锁
+                    self._received_data.append((timestamp, data_str))
+                    self._received_hex.append((timestamp, hex_str))
+                    self._recv_count += 1
+                    raw = self._received_raw
+                    raw += data
+                    if len(raw) > _RAW_MAXLEN:
+                        del raw[:len(raw) - _RAW_MAXLEN]
                     
-                    if self._sse_enabled:
+                    if self._sse_enabled and self._sse_queue is not None:
+                        payload = (elapsed_ms, data_str, hex_str)
                         try:
-                            sse_server = get_sse_server()
-                            if sse_server:
-                                sse_server.broadcast({
-                                    "type": "receive",
-                                    "elapsed_ms": elapsed_ms,
-                                    "data_str": data_str,
-                                    "hex": hex_str
-                                })
-                        except Exception as sse_error:
-                            logger.debug(f"SSE广播失败（不影响串口读取）: {sse_error}")
+                            self._sse_queue.put_nowait(payload)
+                        except queue.Full:
+                            # 队列满时丢弃最旧数据，绝不阻塞读线程
+                            try:
+                                self._sse_queue.get_nowait()
+                            except queue.Empty:
+                                pass
+                            try:
+                                self._sse_queue.put_nowait(payload)
+                            except queue.Full:
+                                pass
                     
                     logger.debug(f"收到数据: {data_str[:100]}")
-                else:
-                    time.sleep(0.005)  # 没有数据时休眠 5ms，降低 CPU 占用
 
             except Exception as e:
                 logger.error(f"读取串口数据错误: {e}")
                 time.sleep(0.1)  # 错误时休眠 100ms
     
-    def _send_data(self, data: str) -> str:
-        """发送字符串数据"""
+    def _send_data(self, data) -> str:
+        """发送字符串数据（也接受 bytes，直接写出不做编码）"""
         if not self._serial_port or not self._serial_port.is_open:
-            return json.dumps({"status": "error", "message": "串口未打开"}, ensure_ascii=False)
+            return _ERR_PORT_NOT_OPEN
 
         try:
-            timestamp = time.perf_counter()
-            self._serial_port.write(data.encode('utf-8'))
+            timestamp = time.perf_counter_ns()
+            if isinstance(data, (bytes, bytearray)):
+                payload = data
+                text = data.decode('utf-8', errors='replace')
+            elif len(data) < 128:
+                payload = _encode_cached(data, 'utf-8')
+                text = data
+            else:
+                payload = data.encode('utf-8')
+                text = data
+            self._serial_port.write(payload)
             with self._lock:
-                self._sent_data.append((timestamp, data))
+                self._sent_data.append((timestamp, text))
+                self._sent_count += 1
+                self._sent_raw += payload
+                if len(self._sent_raw) > _RAW_MAXLEN:
+                    del self._sent_raw[:len(self._sent_raw) - _RAW_MAXLEN]
 
-            logger.debug(f"发送数据: {data[:100]}")
-            event_bus.publish("serial.data_sent", data=data)
+            logger.debug(f"发送数据: {text[:100]}")
+            event_bus.publish("serial.data_sent", data=text)
 
-            return json.dumps({"status": "success", "message": "数据已发送", "length": len(data)}, ensure_ascii=False)
+            return _dumps({"status": "success", "message": "数据已发送", "length": len(data)})
         except Exception as e:
             error_msg = f"发送数据失败: {e}"
             logger.error(error_msg)
-            return json.dumps({"status": "error", "message": error_msg}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": error_msg})
 
     def _send_hex(self, hex_data: str) -> str:
         """发送十六进制数据"""
         if not self._serial_port or not self._serial_port.is_open:
-            return json.dumps({"status": "error", "message": "串口未打开"}, ensure_ascii=False)
+            return _ERR_PORT_NOT_OPEN
 
         try:
-            timestamp = time.perf_counter()
-            data_bytes = bytes.fromhex(hex_data.replace(' ', ''))
+            timestamp = time.perf_counter_ns()
+            data_bytes = bytes.fromhex(hex_data.translate(_HEX_STRIP))
             self._serial_port.write(data_bytes)
 
             with self._lock:
                 self._sent_data.append((timestamp, hex_data))
+                self._sent_count += 1
+                self._sent_raw += data_bytes
+                if len(self._sent_raw) > _RAW_MAXLEN:
+                    del self._sent_raw[:len(self._sent_raw) - _RAW_MAXLEN]
 
             logger.debug(f"发送十六进制: {hex_data}")
             event_bus.publish("serial.data_sent", data=hex_data, hex=True)
 
-            return json.dumps({"status": "success", "message": "十六进制数据已发送", "length": len(data_bytes)}, ensure_ascii=False)
+            return _dumps({"status": "success", "message": "十六进制数据已发送", "length": len(data_bytes)})
         except Exception as e:
             error_msg = f"发送十六进制失败: {e}"
             logger.error(error_msg)
-            return json.dumps({"status": "error", "message": error_msg}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": error_msg})
 
     def _get_status(self) -> str:
         """获取串口状态"""
         is_open = bool(self._serial_port and self._serial_port.is_open)
 
-        return json.dumps({
+        return _dumps({
             "status": "success",
             "is_open": is_open,
             "port": self._serial_port.port if self._serial_port else None,
             "baudrate": self._serial_port.baudrate if self._serial_port else None,
-            "received_count": len(self._received_data),
-            "sent_count": len(self._sent_data)
-        }, ensure_ascii=False)
+            "received_count": self._recv_count,
+            "sent_count": self._sent_count
+        })
     
     def _receive_data(self) -> str:
         """获取并清空已接收的数据"""
-        base_time = time.time()
-        with self._lock:
-            data_list = []
-            for timestamp, data_str in self._received_data:
-                elapsed_ms = (timestamp - self._start_time) * 1000 if hasattr(self, '_start_time') and self._start_time else 0
-                data_list.append({
-                    "timestamp": timestamp,
-                    "elapsed_ms": elapsed_ms,
-                    "data": data_str
-                })
-            self._received_data = []
-        
-        return json.dumps({
+        # 单生产者/单消费者：属性重绑定在 GIL 下是原子的，整体换出缓冲区即可，
+        # 读线程后续 append 自动落到新 deque（依赖 GIL，PyPy 下需改回加锁）
+        snap, self._received_data = self._received_data, deque(maxlen=_BUFFER_MAXLEN)
+
+        start = self._start_time
+        data_list = [
+            {
+                "timestamp": timestamp,
+                "elapsed_ms": (timestamp - start) // 1_000_000,
+                "data": data_str
+            }
+            for timestamp, data_str in snap
+        ]
+
+        return _dumps({
             "status": "success",
             "data": data_list
-        }, ensure_ascii=False)
+        })
     
     def _receive_hex(self) -> str:
         """获取并清空已接收的HEX数据"""
-        with self._lock:
-            data_list = []
-            for timestamp, hex_str in self._received_hex:
-                elapsed_ms = (timestamp - self._start_time) * 1000 if hasattr(self, '_start_time') and self._start_time else 0
-                data_list.append({
-                    "timestamp": timestamp,
-                    "elapsed_ms": elapsed_ms,
-                    "data": hex_str
-                })
-            self._received_hex = []
-        
-        return json.dumps({
+        snap, self._received_hex = self._received_hex, deque(maxlen=_BUFFER_MAXLEN)
+
+        start = self._start_time
+        data_list = [
+            {
+                "timestamp": timestamp,
+                "elapsed_ms": (timestamp - start) // 1_000_000,
+                "data": hex_str
+            }
+            for timestamp, hex_str in snap
+        ]
+
+        return _dumps({
             "status": "success",
             "data": data_list
-        }, ensure_ascii=False)
+        })
     
     def get_received_data(self) -> str:
         """获取所有已接收数据"""
-        with self._lock:
-            return ''.join(self._received_data)
+        return bytes(self._received_raw).decode('utf-8', errors='replace')
+
+    def get_received_bytes(self) -> bytes:
+        """获取所有已接收的原始字节"""
+        return bytes(self._received_raw)
 
     def clear_received_data(self):
         """清空接收缓冲区"""
         with self._lock:
             self._received_data.clear()
+            self._received_hex.clear()
+            self._received_raw.clear()
 
     def get_sent_data(self) -> str:
         """获取所有已发送数据"""
         with self._lock:
-            return ''.join(self._sent_data)
+            return bytes(self._sent_raw).decode('utf-8', errors='replace')
     
+    def _sse_broadcaster(self, sse_queue):
+        """SSE推送线程：从队列取出数据后广播，隔离慢客户端对读线程的影响
+
+        队列有积压时把多帧拼成一次写出，减少每客户端的 write/flush 系统调用。
+        线程持有自己这一代的队列引用：stop→start 重启后旧线程只会消费
+        旧队列里的哨兵然后退出，不会碰新一代的队列。
+        """
+        sse_server = get_sse_server()
+        stop = False
+        while not stop:
+            payload = sse_queue.get()
+            if payload is None:
+                break
+            frames = [_SSE_PREFIX + _encode_receive_payload(*payload) + _SSE_SUFFIX]
+            while len(frames) < 64:
+                try:
+                    payload = sse_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if payload is None:
+                    stop = True
+                    break
+                frames.append(_SSE_PREFIX + _encode_receive_payload(*payload) + _SSE_SUFFIX)
+            try:
+                sse_server.broadcast_raw(frames[0] if len(frames) == 1 else b''.join(frames))
+            except Exception as e:
+                logger.debug(f"SSE广播失败: {e}")
+
     def _start_sse(self) -> str:
         """启动SSE服务器"""
         try:
             server = get_sse_server()
             server.start()
+            # 停止过（或线程已退出）就整套换新：旧队列里可能还留着
+            # _stop_sse 放入的哨兵，复用会让新线程取到哨兵立刻退出
+            if (not self._sse_enabled
+                    or self._sse_thread is None
+                    or not self._sse_thread.is_alive()):
+                self._sse_queue = queue.Queue(maxsize=1024)
+                self._sse_thread = threading.Thread(
+                    target=self._sse_broadcaster, args=(self._sse_queue,), daemon=True
+                )
+                self._sse_thread.start()
             self._sse_enabled = True
             logger.info("SSE模式已启用")
-            return json.dumps({
+            return _dumps({
                 "status": "success",
                 "message": "SSE服务器已启动",
                 "url": f"http://{server.host}:{server.port}/serial_stream"
-            }, ensure_ascii=False)
+            })
         except Exception as e:
             error_msg = f"启动SSE服务器失败: {e}"
             logger.error(error_msg)
-            return json.dumps({"status": "error", "message": error_msg}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": error_msg})
     
     def _stop_sse(self) -> str:
         """停止SSE服务器"""
         try:
             self._sse_enabled = False
+            if self._sse_queue is not None:
+                # 先清空积压再放哨兵：保证哨兵必然入队，推送线程必然退出
+                # （标志已置 False，读线程不会再补新帧）
+                try:
+                    while True:
+                        self._sse_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self._sse_queue.put_nowait(None)  # 通知推送线程退出
+                except queue.Full:
+                    pass
             get_sse_server().stop()
             logger.info("SSE模式已禁用")
-            return json.dumps({"status": "success", "message": "SSE服务器已停止"}, ensure_ascii=False)
+            return _dumps({"status": "success", "message": "SSE服务器已停止"})
         except Exception as e:
             error_msg = f"停止SSE服务器失败: {e}"
             logger.error(error_msg)
-            return json.dumps({"status": "error", "message": error_msg}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": error_msg})
     
     def _get_sse_url(self) -> str:
         """获取SSE连接URL"""
         server = get_sse_server()
         if not self._sse_enabled or not server.running:
-            return json.dumps({
+            return _dumps({
                 "status": "error",
                 "message": "SSE服务器未启动"
-            }, ensure_ascii=False)
-        return json.dumps({
+            })
+        return _dumps({
             "status": "success",
             "url": f"http://{server.host}:{server.port}/serial_stream",
             "enabled": self._sse_enabled
-        }, ensure_ascii=False)
+        })
     
     def _ping(self) -> str:
         """前端心跳保持连接"""
-        return json.dumps({"status": "success", "message": "pong"}, ensure_ascii=False)
+        return _PING_OK
     
     def _remove_sse_client(self) -> str:
         """前端通知移除无效客户端"""
@@ -563,6 +738,6 @@ class SerialAssistantCell(ICell, metaclass=AutoInjectMeta):
             server = get_sse_server()
             server.clients.clear()
             logger.info("已清空SSE客户端列表")
-            return json.dumps({"status": "success", "message": "客户端已移除"}, ensure_ascii=False)
+            return _dumps({"status": "success", "message": "客户端已移除"})
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, ensure_ascii=False)
+            return _dumps({"status": "error", "message": str(e)})
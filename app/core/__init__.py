@@ -7,46 +7,48 @@
 - bridge: MiniBlink 通信桥接
 - handler: 消息处理器
 - util: 工具类（多进程管理）
+
+子模块按需惰性导入（PEP 562）：只用 EventType 的调用方
+（如 run_in_process 派生的子进程）不必加载窗口、桥接等重量级模块。
 """
 
-from .window.main_window import MainWindow
-from .bridge.miniblink_bridge import MiniBlinkBridge
-from .handler.message_handler import MessageHandler
-from .bus.event_bus import event_bus, EventBus
-from .bus.events import EventType
-from .bus.event_models import BaseEvent
-from .util.mp_manager import (
-    MultiprocessManager,
-    get_multiprocess_manager,
-    run_in_process,
-    run_in_process_async
-)
-from .di.container import (
-    DIContainer,
-    get_container,
-    inject,
-    injected,
-    AutoInjectMeta,
-    setup_di_container
-)
+# 名称 -> 所在子模块，首次访问时才真正导入
+_LAZY_IMPORTS = {
+    'MainWindow': '.window.main_window',
+    'MiniBlinkBridge': '.bridge.miniblink_bridge',
+    'MessageHandler': '.handler.message_handler',
+    'event_bus': '.bus.event_bus',
+    'EventBus': '.bus.event_bus',
+    'EventType': '.bus.events',
+    'BaseEvent': '.bus.event_models',
+    'MultiprocessManager': '.util.mp_manager',
+    'get_multiprocess_manager': '.util.mp_manager',
+    'run_in_process': '.util.mp_manager',
+    'run_in_process_async': '.util.mp_manager',
+    'DIContainer': '.di.container',
+    'get_container': '.di.container',
+    'inject': '.di.container',
+    'injected': '.di.container',
+    'AutoInjectMeta': '.di.container',
+    'setup_di_container': '.di.container',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_path = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from importlib import import_module
+    value = getattr(import_module(module_path, __name__), name)
+    # 缓存到模块命名空间，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    'MainWindow',
-    'MiniBlinkBridge',
-    'MessageHandler',
-    'MiniblinkButtonEvent',
-    'event_bus',
-    'EventBus',
-    'EventType',
-    'BaseEvent',
-    'MultiprocessManager',
-    'get_multiprocess_manager',
-    'run_in_process',
-    'run_in_process_async',
-    'DIContainer',
-    'get_container',
-    'inject',
-    'injected',
-    'AutoInjectMeta',
-    'setup_di_container'
-]
+def __dir__():
+    return sorted(__all__)
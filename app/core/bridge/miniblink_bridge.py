@@ -2,11 +2,21 @@
 """
 MiniBlink 通信桥接模块
 封装 Python 与 MiniBlink 之间的通信功能
+
+线程与 GIL 说明：
+- mbRunJs 等出方向调用经 WinDLL 发起，ctypes 在调用期间会释放 GIL
+  （只有 PYFUNCTYPE 原型会持有 GIL，本模块不使用），
+  因此 send_to_js 不会阻塞后台工作线程；
+- 导航/Alert/JsQuery 回调由 MiniBlink 在 UI 线程上触发，
+  进入 Python 时由 ctypes 重新获取 GIL，回调体内应避免长耗时操作
 """
 
 import ctypes
+import itertools
+import json
 import logging
 from ctypes import wintypes, byref
+from functools import lru_cache
 from ..bus.event_bus import event_bus
 from ..bus.events import EventType
 from ..bus.event_models import NavigationEvent, AlertEvent, JsQueryEvent
@@ -14,18 +24,151 @@ from ..bus.event_models import NavigationEvent, AlertEvent, JsQueryEvent
 user32 = ctypes.windll.user32
 logger = logging.getLogger(__name__)
 
+# 脚本编码缓存：重复执行的 JS（如 set_element_value 模板）只做一次 UTF-8 编码，
+# 避免每次调用都重新分配 bytes 缓冲区
+_encode_script = lru_cache(maxsize=512)(lambda script: script.encode('utf-8'))
+
+# 回调函数原型在导入时构造一次即可复用，
+# 避免每次设置回调（尤其是 get_element_value 的每次调用）都重建 ctypes 类型。
+# 结果字符串声明为 c_void_p：MiniBlink 已给出长度，
+# 用 string_at(ptr, len) 取值可以省掉 c_char_p 隐含的 strlen 扫描
+MB_RUNJS_CALLBACK = ctypes.WINFUNCTYPE(
+    None, ctypes.c_void_p, ctypes.c_void_p,
+    ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int
+)
+
+MB_NAVIGATION_CALLBACK = ctypes.WINFUNCTYPE(
+    ctypes.c_bool,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_uint,
+    ctypes.c_char_p
+)
+
+MB_ALERT_CALLBACK = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.c_void_p,
+    ctypes.c_char_p
+)
+
+# get_element_value 的待回调表：以单调递增的请求 ID 为键，
+# 所有读取共享同一个导入时构造的 ctypes thunk。
+# 避免了每次读取都新建闭包和 thunk 的开销，
+# 也消除了 thunk 在 MiniBlink 仍持有指针时被 GC 回收的隐患
+_read_seq = itertools.count(1)
+_pending_reads = {}
+
+
+def _on_runjs_result(webview, param, es, code, str_result, str_len):
+    """共享的 runJs 结果回调：param 携带请求 ID"""
+    callback = _pending_reads.pop(param, None)
+    if callback is None:
+        return
+    try:
+        if str_result and str_len:
+            value = ctypes.string_at(str_result, str_len).decode('utf-8')
+            callback(value)
+    except Exception as e:
+        logger.error(f"[ERROR] 获取元素值失败: {e}")
+
+
+_SHARED_RUNJS_THUNK = MB_RUNJS_CALLBACK(_on_runjs_result)
+
+
+# 常驻页面的辅助函数：注入一次后，set_element_value 只需发送很短的调用语句，
+# JS 引擎可复用已编译的函数而不是每次重新解析整段脚本
+_JS_HELPERS = (
+    "window.__setVal=window.__setVal||function(id,val){"
+    "var e=document.getElementById(id);if(e){e.value=val;}};"
+    "window.__safeEval=window.__safeEval||function(expr){"
+    "try{return (0,eval)(expr);}"
+    "catch(e){console.error('JS Error:',e.message);}};"
+)
+
+MB_DOCUMENT_READY_CALLBACK = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p
+)
+
+MB_JSQUERY_CALLBACK = ctypes.WINFUNCTYPE(
+    ctypes.c_int,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_int64,
+    ctypes.c_int,
+    ctypes.c_char_p
+)
+
 
 class MiniBlinkBridge:
+    # DLL 函数原型只需声明一次（多个实例共享同一 lib）
+    _prototypes_bound = False
+
     def __init__(self, browser):
         self.browser = browser
         self.lib = browser.lib
         self.webview = browser.webview
         self.hwnd = browser.hwnd
-        
+
         self._nav_callback = None
         self._alert_callback = None
         self._jsquery_callback = None
-    
+        self._docready_callback = None
+        self._jsquery_responder = None
+        # 文档就绪回调注册成功前，辅助函数的守卫定义随每次调用内联发送：
+        # 导航会换掉 JS 全局对象，提前注入的 __setVal/__safeEval 活不过
+        # 一次加载
+        self._inline_helpers = True
+        self._pending_scripts = []
+        # 事件类型 -> (订阅版本号, 处理器元组)：回调高频触发，
+        # 缓存已排序的处理器列表，订阅结构变化时按版本号失效
+        self._handler_cache = {}
+        # 回调热路径上把模块全局绑定为实例属性：
+        # LOAD_GLOBAL + 属性查找变为一次 LOAD_FAST + 属性查找
+        self._event_bus = event_bus
+        self._ET_NAV = EventType.NAVIGATION
+        self._ET_ALERT = EventType.ALERT
+        self._ET_JSQUERY = EventType.JSQUERY
+
+        if not MiniBlinkBridge._prototypes_bound:
+            self._bind_prototypes()
+            MiniBlinkBridge._prototypes_bound = True
+
+    def _bind_prototypes(self):
+        """预声明 DLL 函数的 argtypes/restype
+
+        不声明时 ctypes 每次调用都要按通用路径推断参数转换方式，
+        显式声明可以明显降低每次 Python→C 调用的开销。
+        """
+        prototypes = {
+            'mbRunJs': ([ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p,
+                         ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p,
+                         ctypes.c_void_p], None),
+            'mbRunJS': ([ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p,
+                         ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p,
+                         ctypes.c_void_p], None),
+            'mbOnNavigation': ([ctypes.c_void_p, ctypes.c_void_p,
+                                ctypes.c_void_p], None),
+            'mbOnAlertBox': ([ctypes.c_void_p, ctypes.c_void_p,
+                              ctypes.c_void_p], None),
+            'mbOnJsQuery': ([ctypes.c_void_p, ctypes.c_void_p,
+                             ctypes.c_void_p], None),
+            'mbOnDocumentReady': ([ctypes.c_void_p, ctypes.c_void_p,
+                                   ctypes.c_void_p], None),
+            'mbResponseQuery': ([ctypes.c_void_p, ctypes.c_int64,
+                                 ctypes.c_int, ctypes.c_char_p], None),
+        }
+        for name, (argtypes, restype) in prototypes.items():
+            try:
+                func = getattr(self.lib, name)
+                func.argtypes = argtypes
+                func.restype = restype
+            except AttributeError:
+                logger.debug(f"[BRIDGE] DLL 中不存在函数: {name}")
+
     def send_to_js(self, script):
         """发送 JavaScript 代码到页面执行
         
@@ -33,17 +176,37 @@ class MiniBlinkBridge:
             script: JavaScript 代码字符串
         """
         try:
-            logger.debug(f"[BRIDGE] 发送JS: {script[:100]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[BRIDGE] 发送JS: {script[:100]}")
             self.lib.mbRunJs(
                 self.webview, None,
-                script.encode('utf-8'),
+                _encode_script(script),
                 True, None, None, None
             )
-        except Exception as e:
-            logger.error(f"[ERROR] 发送 JS 失败: {e}")
-            import traceback
-            logger.error(f"[ERROR] 堆栈: {traceback.format_exc()}")
+        except Exception:
+            # logging 惰性格式化：只有 handler 真正消费时才格式化堆栈
+            logger.exception("[ERROR] 发送 JS 失败")
     
+    def queue_script(self, script):
+        """暂存 JavaScript 代码，等待 flush_scripts 合并执行
+
+        批量更新 DOM（如一次刷新多个表单字段）时，逐条 send_to_js
+        会产生 N 次 ctypes 跨越和 N 次 JS 解析编译；
+        先 queue 再 flush 可以合并为一次。
+
+        Args:
+            script: JavaScript 代码字符串
+        """
+        self._pending_scripts.append(script)
+
+    def flush_scripts(self):
+        """把暂存的脚本合并为一条 JS 一次性执行"""
+        if not self._pending_scripts:
+            return
+        scripts = self._pending_scripts
+        self._pending_scripts = []
+        self.send_to_js(';\n'.join(scripts))
+
     def eval_js(self, expression):
         """在全局作用域执行 JS 表达式
         
@@ -51,24 +214,34 @@ class MiniBlinkBridge:
             expression: JS 表达式
         """
         try:
-            script = f"try {{ {expression} }} catch(e) {{ console.error('JS Error:', e.message); }}"
-            logger.debug(f"[BRIDGE] evalJS: {expression[:100]}")
+            # try/catch 已随 __safeEval 常驻页面（文档就绪回调负责按文档
+            # 重新注入）：每次只传表达式本身，跨 FFI 的字节数减半，
+            # JS 引擎也能复用同一个已编译函数
+            script = f"__safeEval({json.dumps(expression, ensure_ascii=False)})"
+            if self._inline_helpers:
+                script = _JS_HELPERS + script
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[BRIDGE] evalJS: {expression[:100]}")
             self.lib.mbRunJs(
                 self.webview, None,
-                script.encode('utf-8'),
+                _encode_script(script),
                 True, None, None, None
             )
         except Exception as e:
-            logger.error(f"[ERROR] 执行 JS 失败: {e}")
+            logger.error("[ERROR] 执行 JS 失败: %s", e)
     
     def set_element_value(self, element_id, value):
         """设置 HTML 元素的值
-        
+
         Args:
             element_id: 元素 ID
             value: 要设置的值
         """
-        script = f"document.getElementById('{element_id}').value = '{value}';"
+        # 调用页面内预注册的 __setVal：JS 引擎命中已编译函数缓存，
+        # 不必每次重新解析整条赋值语句；参数经 JSON 编码，避免引号注入
+        script = f"__setVal({json.dumps(element_id)},{json.dumps(value, ensure_ascii=False)})"
+        if self._inline_helpers:
+            script = _JS_HELPERS + script
         self.send_to_js(script)
     
     def get_element_value(self, element_id, callback):
@@ -85,29 +258,47 @@ class MiniBlinkBridge:
             }})()
         """
         
-        def js_callback(webview, param, es, code, str_result, str_len):
-            try:
-                if str_result:
-                    value = ctypes.cast(str_result, ctypes.c_char_p).value.decode('utf-8')
-                    callback(value)
-            except Exception as e:
-                logger.error(f"[ERROR] 获取元素值失败: {e}")
-        
-        MB_RUNJS_CALLBACK = ctypes.WINFUNCTYPE(
-            None, ctypes.c_void_p, ctypes.c_void_p,
-            ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int
+        rid = next(_read_seq)
+        _pending_reads[rid] = callback
+        self.lib.mbRunJS(
+            self.webview, None, _encode_script(script),
+            True, _SHARED_RUNJS_THUNK, rid, None
         )
-        
-        cb = MB_RUNJS_CALLBACK(js_callback)
-        self.lib.mbRunJS(self.webview, None, script.encode('utf-8'), True, cb, None, None)
     
+    def _dispatch_event(self, event_type, event):
+        """用缓存的处理器元组直接派发事件
+
+        存在通配符/一次性/异步订阅时（get_handlers 返回 None）回退 publish。
+        """
+        bus = self._event_bus
+        version = bus.subscription_version
+        cached = self._handler_cache.get(event_type)
+        if cached is None or cached[0] != version:
+            cached = (version, bus.get_handlers(event_type))
+            self._handler_cache[event_type] = cached
+        handlers = cached[1]
+        if handlers is None:
+            return bus.publish(event_type, event)
+        result = None
+        for handler in handlers:
+            try:
+                result = handler(event)
+            except Exception as e:
+                logger.error("[ERROR] 事件处理器错误 [%s]: %s", event_type, e)
+        return result
+
     def _on_navigation_callback(self, webview, param, navigation_type, url):
         """导航回调"""
         try:
-            url_str = ctypes.cast(url, ctypes.c_char_p).value.decode('utf-8') if url else ""
-            logger.debug(f"[DEBUG] 导航: type={navigation_type}, url={url_str}")
+            # 无订阅者时跳过 URL 解码与事件对象构造（导航在页面生命周期中频繁触发）
+            if not self._event_bus.has_subscribers(self._ET_NAV):
+                return True
+            # 原型已声明为 c_char_p，ctypes 直接给出 bytes，无需再 cast 一层
+            url_str = url.decode('utf-8') if url else ""
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[DEBUG] 导航: type={navigation_type}, url={url_str}")
             event = NavigationEvent(navigation_type, url_str)
-            event_bus.publish(EventType.NAVIGATION, event)
+            self._dispatch_event(self._ET_NAV, event)
         except Exception as e:
             logger.error(f"[ERROR] 导航回调错误: {e}")
         return True
@@ -115,14 +306,6 @@ class MiniBlinkBridge:
     def _setup_navigation_callback(self):
         """设置导航回调"""
         try:
-            MB_NAVIGATION_CALLBACK = ctypes.WINFUNCTYPE(
-                ctypes.c_bool,
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_uint,
-                ctypes.c_char_p
-            )
-            
             self._nav_callback = MB_NAVIGATION_CALLBACK(self._on_navigation_callback)
             self.lib.mbOnNavigation(self.webview, self._nav_callback, None)
             logger.info("[INFO] 导航回调已设置")
@@ -134,22 +317,19 @@ class MiniBlinkBridge:
     def _on_alert_callback(self, webview, msg):
         """Alert 回调"""
         try:
-            msg_str = ctypes.cast(msg, ctypes.c_char_p).value.decode('utf-8') if msg else ""
-            logger.debug(f"[DEBUG] 收到 Alert: {msg_str}")
+            if not self._event_bus.has_subscribers(self._ET_ALERT):
+                return
+            msg_str = msg.decode('utf-8') if msg else ""
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[DEBUG] 收到 Alert: {msg_str}")
             event = AlertEvent(msg_str)
-            event_bus.publish(EventType.ALERT, event)
+            self._dispatch_event(self._ET_ALERT, event)
         except Exception as e:
             logger.error(f"[ERROR] Alert 回调错误: {e}")
     
     def _setup_alert_callback(self):
         """设置 Alert 回调"""
         try:
-            MB_ALERT_CALLBACK = ctypes.WINFUNCTYPE(
-                None,
-                ctypes.c_void_p,
-                ctypes.c_char_p
-            )
-            
             self._alert_callback = MB_ALERT_CALLBACK(self._on_alert_callback)
             self.lib.mbOnAlertBox(self.webview, self._alert_callback, None)
             logger.info("[INFO] Alert 回调已设置")
@@ -161,11 +341,18 @@ class MiniBlinkBridge:
     def _on_js_query(self, webview, param, es, query_id, custom_msg, msg):
         """JsQuery 回调"""
         try:
-            msg_str = ctypes.cast(msg, ctypes.c_char_p).value.decode('utf-8') if msg else ""
-            logger.debug(f"[DEBUG] 收到 JsQuery: {msg_str}")
+            msg_str = msg.decode('utf-8') if msg else ""
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[DEBUG] 收到 JsQuery: {msg_str}")
             
             event = JsQueryEvent(webview, query_id, custom_msg, msg_str)
-            result = event_bus.publish(EventType.JSQUERY, event)
+            # JsQuery 几乎每次 JS→Python 调用都会触发，且通常只有一个响应者；
+            # 注册了直接响应者时跳过 pub/sub 的订阅者遍历与优先级排序
+            responder = self._jsquery_responder
+            if responder is not None:
+                result = responder(event)
+            else:
+                result = self._dispatch_event(self._ET_JSQUERY, event)
             
             if result is not None:
                 self.lib.mbResponseQuery(
@@ -179,19 +366,18 @@ class MiniBlinkBridge:
             logger.error(f"[ERROR] JsQuery 回调错误: {e}")
         return 0
     
+    def set_jsquery_responder(self, responder):
+        """注册 JsQuery 的直接响应者
+
+        Args:
+            responder: 接收 JsQueryEvent 并返回响应字符串（或 None）的函数；
+                       传 None 恢复走事件总线
+        """
+        self._jsquery_responder = responder
+
     def _setup_js_query_callback(self):
         """设置 JsQuery 回调"""
         try:
-            MB_JSQUERY_CALLBACK = ctypes.WINFUNCTYPE(
-                ctypes.c_int,
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_void_p,
-                ctypes.c_int64,
-                ctypes.c_int,
-                ctypes.c_char_p
-            )
-            
             self._jsquery_callback = MB_JSQUERY_CALLBACK(self._on_js_query)
             self.lib.mbOnJsQuery(self.webview, self._jsquery_callback, None)
             logger.info("[INFO] JsQuery 回调已设置")
@@ -200,8 +386,40 @@ class MiniBlinkBridge:
             logger.error(f"[ERROR] 设置 JsQuery 回调失败: {e}")
             return False
     
+    def _on_document_ready(self, webview, param, frame_id):
+        """文档就绪回调：每个新文档都要重新注入辅助函数
+
+        导航/刷新会创建全新的 JS 全局对象，之前注入的辅助函数随旧文档
+        一起销毁；window.__setVal|| 守卫保证重复注入幂等。
+        """
+        try:
+            self.send_to_js(_JS_HELPERS)
+        except Exception as e:
+            logger.error(f"[ERROR] 注入 JS 辅助函数失败: {e}")
+
+    def _setup_document_ready_callback(self):
+        """设置文档就绪回调（驱动辅助函数随文档生命周期重新注入）"""
+        if not hasattr(self.lib, 'mbOnDocumentReady'):
+            logger.warning("[BRIDGE] mbOnDocumentReady 不可用，辅助函数将随调用内联发送")
+            return False
+        try:
+            self._docready_callback = MB_DOCUMENT_READY_CALLBACK(self._on_document_ready)
+            self.lib.mbOnDocumentReady(self.webview, self._docready_callback, None)
+            self._inline_helpers = False
+            logger.info("[INFO] 文档就绪回调已设置")
+            return True
+        except Exception as e:
+            logger.error(f"[ERROR] 设置文档就绪回调失败: {e}")
+            return False
+
+    def install_js_helpers(self):
+        """向当前页面注入常驻 JS 辅助函数（导航后由文档就绪回调重新注入）"""
+        self.send_to_js(_JS_HELPERS)
+
     def setup_all_callbacks(self):
         """设置所有回调"""
         self._setup_navigation_callback()
         self._setup_alert_callback()
         self._setup_js_query_callback()
+        self._setup_document_ready_callback()
+        self.install_js_helpers()
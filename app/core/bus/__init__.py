@@ -1,51 +1,44 @@
-from app.core.bus.events import EventType
-from app.core.bus.event_bus import (
-    EventBus,
-    EventPriority,
-    event_bus,
-    get_event_bus,
-    event,
-    event_once,
-    event_pattern,
-    event_wildcard,
-    emitter,
-    subscribe_dynamic,
-    subscribe_pattern_dynamic,
-    subscribe_once_dynamic,
-    set_event_namespace,
-    get_event_namespace,
-    register_component_handlers,
-    register_event_class
-)
-from app.core.bus.event_models import (
-    BaseEvent,
-    NavigationEvent,
-    AlertEvent,
-    JsQueryEvent,
-    FadeOutEvent
-)
+# 名称 -> 所在子模块，首次访问时才真正导入（PEP 562）
+_LAZY_IMPORTS = {
+    'EventType': 'app.core.bus.events',
+    'EventBus': 'app.core.bus.event_bus',
+    'EventPriority': 'app.core.bus.event_bus',
+    'event_bus': 'app.core.bus.event_bus',
+    'get_event_bus': 'app.core.bus.event_bus',
+    'event': 'app.core.bus.event_bus',
+    'event_once': 'app.core.bus.event_bus',
+    'event_pattern': 'app.core.bus.event_bus',
+    'event_wildcard': 'app.core.bus.event_bus',
+    'emitter': 'app.core.bus.event_bus',
+    'subscribe_dynamic': 'app.core.bus.event_bus',
+    'subscribe_pattern_dynamic': 'app.core.bus.event_bus',
+    'subscribe_once_dynamic': 'app.core.bus.event_bus',
+    'set_event_namespace': 'app.core.bus.event_bus',
+    'get_event_namespace': 'app.core.bus.event_bus',
+    'register_component_handlers': 'app.core.bus.event_bus',
+    'register_event_class': 'app.core.bus.event_bus',
+    'BaseEvent': 'app.core.bus.event_models',
+    'NavigationEvent': 'app.core.bus.event_models',
+    'AlertEvent': 'app.core.bus.event_models',
+    'JsQueryEvent': 'app.core.bus.event_models',
+    'FadeOutEvent': 'app.core.bus.event_models',
+}
 
-__all__ = [
-    "EventType",
-    "EventBus",
-    "EventPriority",
-    "event_bus",
-    "get_event_bus",
-    "event",
-    "event_once",
-    "event_pattern",
-    "event_wildcard",
-    "emitter",
-    "subscribe_dynamic",
-    "subscribe_pattern_dynamic",
-    "subscribe_once_dynamic",
-    "set_event_namespace",
-    "get_event_namespace",
-    "register_component_handlers",
-    "register_event_class",
-    "BaseEvent",
-    "NavigationEvent",
-    "AlertEvent",
-    "JsQueryEvent",
-    "FadeOutEvent"
-]
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_path = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from importlib import import_module
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
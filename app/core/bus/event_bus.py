@@ -7,24 +7,155 @@
 """
 
 import asyncio
+import bisect
 import inspect
 import logging
-import fnmatch
 import re
+import sys
+import weakref
 from typing import Callable, Dict, List, Any, Optional, Type, Set, Tuple
-from functools import wraps
+from functools import lru_cache, wraps
 from .events import EventType
 from .event_models import BaseEvent, AlertEvent, JsQueryEvent, FadeOutEvent, NavigationEvent, ButtonClickEvent, CalcResultEvent, SystemCommandEvent
 
 logger = logging.getLogger(__name__)
 
-_EVENT_HANDLERS_REGISTRY: Dict[str, Set[Callable]] = {}
-_ONCE_HANDLERS_REGISTRY: Dict[str, Set[Callable]] = {}
+# 用 list 保存注册顺序：装饰器每次都会生成新的 wrapper，不存在重复注册，
+# set 的元组哈希纯属开销，且会打乱同优先级处理器的派发顺序
+_EVENT_HANDLERS_REGISTRY: Dict[str, List[Tuple[Callable, int]]] = {}
+_ONCE_HANDLERS_REGISTRY: Dict[str, List[Tuple[Callable, int]]] = {}
 _WILDCARD_HANDLERS: Dict[str, List[Tuple[Callable, int]]] = {}
+# 模式 -> 已注册处理器 id 集合，订阅时 O(1) 去重；
+# 条目列表持有处理器强引用，列表不删则 id 不会被复用
+_WILDCARD_HANDLER_IDS: Dict[str, Set[int]] = {}
 _WILDCARD_HANDLER_FUNCTIONS: List[Callable] = []
 _EVENT_NAMESPACE: str = ""
 
 
+# Python 3.12+ 的急切任务工厂：同步就能完成的协程不再强制推迟一个循环迭代
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+_EAGER_CONFIGURED_LOOPS = weakref.WeakSet()
+
+
+def _create_task_eager(loop, coro):
+    """在支持的版本上为事件循环安装急切任务工厂（每个循环只装一次）"""
+    if _EAGER_TASK_FACTORY is not None and loop not in _EAGER_CONFIGURED_LOOPS:
+        if loop.get_task_factory() is None:
+            loop.set_task_factory(_EAGER_TASK_FACTORY)
+        _EAGER_CONFIGURED_LOOPS.add(loop)
+    return loop.create_task(coro)
+
+
+def _is_coro_handler(handler: Callable) -> bool:
+    """iscoroutinefunction 的记忆化版本
+
+    inspect.iscoroutinefunction 每次都要走 __wrapped__ 链，
+    派发热路径上按处理器缓存一次即可；结果存在底层函数对象上，
+    绑定方法共享其 __func__ 的缓存。
+    """
+    func = getattr(handler, "__func__", handler)
+    cached = getattr(func, "_eb_is_coro", None)
+    if cached is None:
+        cached = asyncio.iscoroutinefunction(func)
+        try:
+            func._eb_is_coro = cached
+        except (AttributeError, TypeError):
+            pass
+    return cached
+
+
+@lru_cache(maxsize=512)
+def _compiled_pattern(pattern: str) -> re.Pattern:
+    """把通配符模式编译成正则并缓存（每个模式只做一次替换+编译）"""
+    regex_pattern = pattern.replace(".", "\\.").replace("*", ".*").replace("?", ".")
+    return re.compile(f"^{regex_pattern}$")
+
+
+@lru_cache(maxsize=512)
+def _classify_pattern(pattern: str) -> tuple:
+    """按形态给模式分类，常见的前缀/后缀式模式可以完全绕开正则引擎
+
+    返回 (kind, arg)：
+    - ("all", None)           仅 "*"
+    - ("prefix", 前缀字面量)   形如 "ns.*"
+    - ("suffix", 后缀字面量)   形如 "*.click"
+    - ("regex", 已编译正则)    其余情况
+    """
+    if pattern == "*":
+        return ("all", None)
+    if re.fullmatch(r"[^*?\[\]]+\*", pattern):
+        return ("prefix", pattern[:-1])
+    if re.fullmatch(r"\*[^*?\[\]]+", pattern):
+        return ("suffix", pattern[1:])
+    return ("regex", _compiled_pattern(pattern))
+
+
+@lru_cache(maxsize=2048)
+def _pattern_match(event_name: str, pattern: str) -> bool:
+    """缓存 (事件名, 模式) 的匹配结果，publish 热路径上只剩一次字典查找"""
+    kind, arg = _classify_pattern(pattern)
+    if kind == "all":
+        return True
+    if kind == "prefix":
+        return event_name.startswith(arg)
+    if kind == "suffix":
+        return event_name.endswith(arg)
+    return arg.match(event_name) is not None
+
+
+# EventType -> 事件名缓存：Enum.__str__ 是方法调用，热路径上换成一次字典查找；
+# 内置事件类型在导入时预填充，字符串键直接映射到自身。
+# 缓存值统一驻留（sys.intern）：字典查找对驻留串先比较指针再比较哈希
+_EVENT_NAME_CACHE: Dict[Any, str] = {et: sys.intern(et.value) for et in EventType}
+
+
+def _name(event_type) -> str:
+    name = _EVENT_NAME_CACHE.get(event_type)
+    if name is None:
+        name = _EVENT_NAME_CACHE.setdefault(event_type, sys.intern(str(event_type)))
+    return name
+
+
+class _StrongRef:
+    """与 weakref.ref 同调用协议的强引用包装，用于不适合弱引用的处理器"""
+
+    __slots__ = ('_obj',)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __call__(self):
+        return self._obj
+
+
+def _make_handler_ref(handler: Callable):
+    """为处理器创建引用：组件方法和模块级函数用弱引用，组件被释放后
+    订阅自动失效，不必显式 unsubscribe；lambda/闭包/嵌套函数往往只被
+    订阅处持有，弱引用会立即失效，退回强引用保持原语义。
+    """
+    if inspect.ismethod(handler):
+        return weakref.WeakMethod(handler)
+    if (inspect.isfunction(handler)
+            and handler.__name__ != "<lambda>"
+            and "<locals>" not in handler.__qualname__):
+        return weakref.ref(handler)
+    return _StrongRef(handler)
+
+
+class _DispatchPlan:
+    """单个事件名的派发计划：publish / publish_async 共享的只读快照
+
+    只缓存不随派发变化且可安全持有的部分（事件类、匹配的通配符条目）；
+    普通处理器持弱引用，必须在每次派发时现场解引用，不进计划缓存。
+    """
+
+    __slots__ = ('event_class', 'wildcards')
+
+    def __init__(self, event_class, wildcards):
+        self.event_class = event_class
+        self.wildcards = wildcards
+
+
 class EventPriority:
     LOWEST = 0
     LOW = 100
@@ -35,107 +166,169 @@ class EventPriority:
 
 class EventBus:
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._subscriber_priority: Dict[str, Dict[int, List[Callable]]] = {}
+        # 事件名 -> 有序条目列表 (-priority, 插入序号, handler引用)：
+        # bisect 插入后天然按优先级降序、同优先级按订阅先后排列，
+        # 免去 publish 时的重排；插入序号唯一，比较永远落不到引用对象上。
+        # 引用由 _make_handler_ref 创建，组件方法为弱引用，组件被 GC 后
+        # 条目在下次派发时就地剔除
+        self._subscribers: Dict[str, List[Tuple[int, int, Callable]]] = {}
+        self._sub_seq = 0
         self._event_classes: Dict[str, Type[BaseEvent]] = {}
         self._once_subscribers: Dict[str, Set[Callable]] = {}
-        
-        self._event_classes[str(EventType.ALERT)] = AlertEvent
-        self._event_classes[str(EventType.JSQUERY)] = JsQueryEvent
-        self._event_classes[str(EventType.FADE_OUT)] = FadeOutEvent
-        self._event_classes[str(EventType.NAVIGATION)] = NavigationEvent
-        self._event_classes[str(EventType.BUTTON_CLICK)] = ButtonClickEvent
-        self._event_classes[str(EventType.CALC_RESULT)] = CalcResultEvent
-        self._event_classes[str(EventType.SYSTEM_COMMAND)] = SystemCommandEvent
+        # 订阅结构版本号：每次订阅/取消订阅递增，供外部缓存处理器列表时判断失效
+        self._subscription_version = 0
+        # 事件名 -> (版本号, 已合并排序的通配符处理器元组)，
+        # 模式集合稳定时每次 publish 只需一次字典查找
+        self._wildcard_cache: Dict[str, Tuple[int, tuple]] = {}
+        # 命名空间 -> 该命名空间下已订阅的事件名集合，clear(namespace) 按索引
+        # 直接定位，不再对全部键做 fnmatch 扫描；残留的陈旧条目在 pop 时自然失效
+        self._by_namespace: Dict[str, Set[str]] = {}
+        # 事件名 -> (版本号, 派发计划)，两条 publish 路径共用
+        self._plan_cache: Dict[str, Tuple[int, _DispatchPlan]] = {}
+
+        self._event_classes[_name(EventType.ALERT)] = AlertEvent
+        self._event_classes[_name(EventType.JSQUERY)] = JsQueryEvent
+        self._event_classes[_name(EventType.FADE_OUT)] = FadeOutEvent
+        self._event_classes[_name(EventType.NAVIGATION)] = NavigationEvent
+        self._event_classes[_name(EventType.BUTTON_CLICK)] = ButtonClickEvent
+        self._event_classes[_name(EventType.CALC_RESULT)] = CalcResultEvent
+        self._event_classes[_name(EventType.SYSTEM_COMMAND)] = SystemCommandEvent
     
     def register_event_class(self, event_type: EventType, event_class: Type[BaseEvent]):
-        self._event_classes[str(event_type)] = event_class
+        self._event_classes[_name(event_type)] = event_class
         logger.info(f"已注册事件类: {event_type} -> {event_class.__name__}")
     
+    def _index_namespace(self, event_name: str):
+        """把带命名空间的事件名记入命名空间索引（按第一个 '.' 切分）"""
+        namespace, sep, _ = event_name.partition(".")
+        if sep:
+            self._by_namespace.setdefault(namespace, set()).add(event_name)
+
     def subscribe(self, event_type: EventType, handler: Callable, priority: int = EventPriority.NORMAL):
-        event_name = str(event_type)
-        if event_name not in self._subscribers:
-            self._subscribers[event_name] = []
-            self._subscriber_priority[event_name] = {}
-        
-        if priority not in self._subscriber_priority[event_name]:
-            self._subscriber_priority[event_name][priority] = []
-        
-        if handler not in self._subscriber_priority[event_name][priority]:
-            self._subscriber_priority[event_name][priority].append(handler)
-            
-        if handler not in self._subscribers[event_name]:
-            self._subscribers[event_name].append(handler)
-        
+        event_name = _name(event_type)
+        self._index_namespace(event_name)
+        entries = self._subscribers.setdefault(event_name, [])
+        # 订阅是冷路径，线性解引用去重即可（WeakMethod 解出的绑定方法按 == 比较）
+        if not any(entry[2]() == handler for entry in entries):
+            self._sub_seq += 1
+            bisect.insort(entries, (-priority, self._sub_seq, _make_handler_ref(handler)))
+        self._subscription_version += 1
         logger.debug(f"[EVENT] 已订阅事件: {event_name} (优先级: {priority}) -> {handler.__name__}")
     
+    @staticmethod
+    def _add_wildcard_handler(pattern: str, handler: Callable, priority: int):
+        """去重后按优先级降序插入，O(1) 去重 + O(log N) 定位，免去整表重排"""
+        ids = _WILDCARD_HANDLER_IDS.setdefault(pattern, set())
+        if id(handler) in ids:
+            return
+        ids.add(id(handler))
+        # insort_right 对同优先级插在末尾，保持订阅先后顺序
+        bisect.insort(
+            _WILDCARD_HANDLERS.setdefault(pattern, []),
+            (handler, priority),
+            key=lambda entry: -entry[1],
+        )
+
     def subscribe_wildcard(self, handler: Callable, priority: int = EventPriority.NORMAL):
-        pattern = "*"
-        if pattern not in _WILDCARD_HANDLERS:
-            _WILDCARD_HANDLERS[pattern] = []
-        
-        if (handler, priority) not in [(h, p) for h, p in _WILDCARD_HANDLERS[pattern]]:
-            _WILDCARD_HANDLERS[pattern].append((handler, priority))
-            _WILDCARD_HANDLERS[pattern].sort(key=lambda x: x[1], reverse=True)
+        self._add_wildcard_handler("*", handler, priority)
+        self._subscription_version += 1
         logger.debug(f"[EVENT] 已订阅通配符事件 (优先级: {priority}) -> {handler.__name__}")
-    
+
     def subscribe_pattern(self, pattern: str, handler: Callable, priority: int = EventPriority.NORMAL):
-        if pattern not in _WILDCARD_HANDLERS:
-            _WILDCARD_HANDLERS[pattern] = []
-        
-        if (handler, priority) not in [(h, p) for h, p in _WILDCARD_HANDLERS[pattern]]:
-            _WILDCARD_HANDLERS[pattern].append((handler, priority))
-            _WILDCARD_HANDLERS[pattern].sort(key=lambda x: x[1], reverse=True)
+        self._add_wildcard_handler(pattern, handler, priority)
+        self._subscription_version += 1
         logger.debug(f"[EVENT] 已订阅模式事件: {pattern} (优先级: {priority}) -> {handler.__name__}")
     
     def subscribe_once(self, event_type: EventType, handler: Callable):
-        event_name = str(event_type)
+        event_name = _name(event_type)
+        self._index_namespace(event_name)
         if event_name not in self._once_subscribers:
             self._once_subscribers[event_name] = set()
         self._once_subscribers[event_name].add(handler)
+        self._subscription_version += 1
         logger.debug(f"[EVENT] 已订阅一次性事件: {event_name} -> {handler.__name__}")
     
     def unsubscribe(self, event_type: EventType, handler: Optional[Callable] = None):
-        event_name = str(event_type)
+        event_name = _name(event_type)
+        self._subscription_version += 1
         if handler is None:
             self._subscribers.pop(event_name, None)
-            self._subscriber_priority.pop(event_name, None)
             self._once_subscribers.pop(event_name, None)
             logger.debug(f"已取消订阅所有事件处理器: {event_type}")
         else:
-            if event_name in self._subscribers:
-                self._subscribers[event_name] = [h for h in self._subscribers[event_name] if h != handler]
+            entries = self._subscribers.get(event_name)
+            if entries is not None:
+                # 顺带剔除已失效的弱引用条目
+                entries[:] = [
+                    entry for entry in entries
+                    if entry[2]() is not None and entry[2]() != handler
+                ]
             if event_name in self._once_subscribers:
                 self._once_subscribers[event_name].discard(handler)
             logger.debug(f"已取消订阅事件: {event_type}")
     
     def _match_pattern(self, event_name: str, pattern: str) -> bool:
-        if pattern == "*":
-            return True
-        if fnmatch.fnmatch(event_name, pattern):
-            return True
-        regex_pattern = pattern.replace(".", "\\.").replace("*", ".*").replace("?", ".")
-        if re.match(f"^{regex_pattern}$", event_name):
-            return True
-        return False
+        return _pattern_match(event_name, pattern)
     
+    def _matching_wildcards(self, event_name: str) -> tuple:
+        """返回匹配该事件的 (handler, priority) 元组，按优先级降序，带版本号缓存"""
+        version = self._subscription_version
+        cached = self._wildcard_cache.get(event_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        if not _WILDCARD_HANDLERS:
+            entries = ()
+        else:
+            merged = []
+            for pattern, handlers in _WILDCARD_HANDLERS.items():
+                if self._match_pattern(event_name, pattern):
+                    merged.extend(handlers)
+            merged.sort(key=lambda x: x[1], reverse=True)
+            entries = tuple(merged)
+        self._wildcard_cache[event_name] = (version, entries)
+        return entries
+
     def _get_sorted_handlers(self, event_name: str) -> List[Callable]:
+        """解引用得到按优先级排序的处理器列表，顺带就地剔除已 GC 的条目
+
+        不缓存解引用结果：缓存会持有强引用，把本应被回收的组件钉在内存里。
+        条目列表本身已排好序，这里只是一次线性解引用。
+        """
+        entries = self._subscribers.get(event_name)
+        if not entries:
+            return []
         handlers = []
-        priorities = sorted(self._subscriber_priority.get(event_name, {}).keys(), reverse=True)
-        for priority in priorities:
-            handlers.extend(self._subscriber_priority[event_name][priority])
-        handlers.extend([h for h in self._subscribers.get(event_name, []) if h not in handlers])
+        dead = False
+        for entry in entries:
+            handler = entry[2]()
+            if handler is None:
+                dead = True
+            else:
+                handlers.append(handler)
+        if dead:
+            entries[:] = [entry for entry in entries if entry[2]() is not None]
+            if not entries:
+                del self._subscribers[event_name]
+            self._subscription_version += 1
         return handlers
-    
+
+    def _sorted_handlers(self, event_name: str) -> tuple:
+        """供 publish 热路径与外部缓存方使用的元组形式"""
+        return tuple(self._get_sorted_handlers(event_name))
+
     def _invoke_handler(self, handler: Callable, event_name: str, event: Any = None, *args, **kwargs) -> Any:
         """统一调用事件处理器，处理同步和异步函数"""
-        if inspect.iscoroutinefunction(handler):
+        if _is_coro_handler(handler):
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    return asyncio.create_task(handler(event or event_name, *args, **kwargs))
-                else:
-                    return loop.run_until_complete(handler(event or event_name, *args, **kwargs))
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            try:
+                if loop is not None:
+                    return _create_task_eager(loop, handler(event or event_name, *args, **kwargs))
+                return asyncio.get_event_loop().run_until_complete(
+                    handler(event or event_name, *args, **kwargs)
+                )
             except RuntimeError:
                 logger.warning(f"异步处理器需要事件循环: {handler.__name__}")
         else:
@@ -144,11 +337,23 @@ class EventBus:
             else:
                 return handler(event_name, *args, **kwargs)
     
-    def _create_event(self, event_name: str, args: tuple, kwargs: dict) -> Any:
+    def _build_plan(self, event_name: str) -> _DispatchPlan:
+        """构建（或复用）事件名对应的派发计划，带版本号缓存"""
+        version = self._subscription_version
+        cached = self._plan_cache.get(event_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        plan = _DispatchPlan(
+            self._event_classes.get(event_name),
+            self._matching_wildcards(event_name),
+        )
+        self._plan_cache[event_name] = (version, plan)
+        return plan
+
+    def _create_event(self, event_class, args: tuple, kwargs: dict) -> Any:
         """统一创建事件对象"""
-        if event_name in self._event_classes:
+        if event_class is not None:
             try:
-                event_class = self._event_classes[event_name]
                 if args and isinstance(args[0], BaseEvent):
                     return args[0]
                 else:
@@ -156,49 +361,53 @@ class EventBus:
             except Exception as e:
                 logger.warning(f"[WARNING] 创建事件对象失败: {e}")
         return None
-    
+
     def publish(self, event_type: EventType, *args, **kwargs):
-        event_name = str(event_type)
-        
-        event = self._create_event(event_name, args, kwargs)
+        event_name = _name(event_type)
+
+        # 无人监听时直接返回，连事件对象都不构造
+        if (event_name not in self._subscribers
+                and event_name not in self._once_subscribers
+                and not _WILDCARD_HANDLERS):
+            return None
+
+        plan = self._build_plan(event_name)
+        event = self._create_event(plan.event_class, args, kwargs)
         result = None
-        
-        for handler in self._get_sorted_handlers(event_name):
+        invoke = self._invoke_handler
+
+        for handler in self._sorted_handlers(event_name):
             try:
-                result = self._invoke_handler(handler, event_name, event, *args, **kwargs)
+                result = invoke(handler, event_name, event, *args, **kwargs)
             except Exception as e:
-                logger.error(f"[ERROR] 事件处理器错误 [{event_type}]: {e}")
-                import traceback
-                logger.error(f"[ERROR] 堆栈跟踪: {traceback.format_exc()}")
-        
-        for pattern, handlers in _WILDCARD_HANDLERS.items():
-            if self._match_pattern(event_name, pattern):
-                for handler, priority in handlers:
-                    try:
-                        logger.debug(f"[TRACE-WILDCARD] 调用通配符处理器: handler={handler.__name__}, pattern={pattern}")
-                        result = self._invoke_handler(handler, event_name, event, **kwargs)
-                    except Exception as e:
-                        logger.error(f"[ERROR] 通配符事件处理器错误 [{pattern}]: {e}")
-                        import traceback
-                        logger.error(f"[ERROR] 堆栈跟踪: {traceback.format_exc()}")
-        
-        if event_name in self._once_subscribers:
-            handlers_to_remove = list(self._once_subscribers[event_name])
-            for handler in handlers_to_remove:
+                # 堆栈只在 DEBUG 级别才格式化，失败路径不做多 KB 的字符串拼装
+                logger.error("[ERROR] 事件处理器错误 [%s]: %s", event_type, e,
+                             exc_info=logger.isEnabledFor(logging.DEBUG))
+
+        for handler, priority in plan.wildcards:
+            try:
+                result = invoke(handler, event_name, event, **kwargs)
+            except Exception as e:
+                logger.error("[ERROR] 通配符事件处理器错误 [%s]: %s", event_name, e,
+                             exc_info=logger.isEnabledFor(logging.DEBUG))
+
+        once_set = self._once_subscribers.get(event_name)
+        if once_set:
+            # pop 逐个取出：不做 list() 快照拷贝，空集合时整段自然跳过
+            while once_set:
+                handler = once_set.pop()
                 try:
-                    logger.debug(f"[TRACE-ONCE] 调用一次性处理器: handler={handler.__name__}")
-                    result = self._invoke_handler(handler, event_name, event, *args, **kwargs)
+                    result = invoke(handler, event_name, event, *args, **kwargs)
                 except Exception as e:
-                    logger.error(f"[ERROR] 一次性事件处理器错误 [{event_type}]: {e}")
-                    import traceback
-                    logger.error(f"[ERROR] 堆栈跟踪: {traceback.format_exc()}")
-            self._once_subscribers[event_name].clear()
-        
+                    logger.error("[ERROR] 一次性事件处理器错误 [%s]: %s", event_type, e,
+                                 exc_info=logger.isEnabledFor(logging.DEBUG))
+            self._once_subscribers.pop(event_name, None)
+
         return result
     
     async def _invoke_handler_async(self, handler: Callable, event_name: str, event: Any = None, *args, **kwargs) -> Any:
         """统一异步调用事件处理器"""
-        if inspect.iscoroutinefunction(handler):
+        if _is_coro_handler(handler):
             if event:
                 return await handler(event)
             else:
@@ -210,68 +419,109 @@ class EventBus:
                 return handler(event_name, *args, **kwargs)
     
     async def publish_async(self, event_type: EventType, *args, **kwargs):
-        event_name = str(event_type)
-        
-        event = self._create_event(event_name, args, kwargs)
+        event_name = _name(event_type)
+
+        if (event_name not in self._subscribers
+                and event_name not in self._once_subscribers
+                and not _WILDCARD_HANDLERS):
+            return None
+
+        plan = self._build_plan(event_name)
+        event = self._create_event(plan.event_class, args, kwargs)
         result = None
-        
-        for handler in self._get_sorted_handlers(event_name):
+        invoke = self._invoke_handler_async
+
+        for handler in self._sorted_handlers(event_name):
             try:
-                result = await self._invoke_handler_async(handler, event_name, event, *args, **kwargs)
+                result = await invoke(handler, event_name, event, *args, **kwargs)
             except Exception as e:
-                logger.error(f"[ERROR] 事件处理器错误 [{event_type}]: {e}")
-        
-        for pattern, handlers in _WILDCARD_HANDLERS.items():
-            if self._match_pattern(event_name, pattern):
-                for handler, priority in handlers:
-                    try:
-                        result = await self._invoke_handler_async(handler, event_name, event, **kwargs)
-                    except Exception as e:
-                        logger.error(f"[ERROR] 通配符事件处理器错误 [{pattern}]: {e}")
-        
-        if event_name in self._once_subscribers:
-            handlers_to_remove = list(self._once_subscribers[event_name])
-            for handler in handlers_to_remove:
+                logger.error("[ERROR] 事件处理器错误 [%s]: %s", event_type, e,
+                             exc_info=logger.isEnabledFor(logging.DEBUG))
+
+        for handler, priority in plan.wildcards:
+            try:
+                result = await invoke(handler, event_name, event, **kwargs)
+            except Exception as e:
+                logger.error("[ERROR] 通配符事件处理器错误 [%s]: %s", event_name, e,
+                             exc_info=logger.isEnabledFor(logging.DEBUG))
+
+        once_set = self._once_subscribers.get(event_name)
+        if once_set:
+            while once_set:
+                handler = once_set.pop()
                 try:
-                    result = await self._invoke_handler_async(handler, event_name, event, *args, **kwargs)
+                    result = await invoke(handler, event_name, event, *args, **kwargs)
                 except Exception as e:
-                    logger.error(f"[ERROR] 一次性事件处理器错误 [{event_type}]: {e}")
-            self._once_subscribers[event_name].clear()
-        
+                    logger.error("[ERROR] 一次性事件处理器错误 [%s]: %s", event_type, e,
+                                 exc_info=logger.isEnabledFor(logging.DEBUG))
+            self._once_subscribers.pop(event_name, None)
+
         return result
     
     def has_subscribers(self, event_type: EventType) -> bool:
-        event_name = str(event_type)
-        return len(self._subscribers.get(event_name, [])) > 0
+        event_name = _name(event_type)
+        if self._subscribers.get(event_name):
+            return True
+        if self._once_subscribers.get(event_name):
+            return True
+        # 存在通配符订阅者时保守返回 True，具体匹配留给 publish 判断
+        return bool(_WILDCARD_HANDLERS)
     
     def get_matching_subscribers(self, event_name: str) -> List[Callable]:
         handlers = self._get_sorted_handlers(event_name)
-        for handler, pattern, _ in _WILDCARD_HANDLERS:
-            if self._match_pattern(event_name, pattern) and handler not in handlers:
-                handlers.append(handler)
+        # _WILDCARD_HANDLERS 是 模式 -> [(handler, priority)]，此前在这里
+        # 被当成三元组序列解包，任何通配符订阅都会让本方法抛 ValueError
+        for pattern, entries in _WILDCARD_HANDLERS.items():
+            if self._match_pattern(event_name, pattern):
+                for handler, _priority in entries:
+                    if handler not in handlers:
+                        handlers.append(handler)
         return handlers
     
     def clear(self, namespace: Optional[str] = None):
+        self._subscription_version += 1
         if namespace:
-            pattern = f"{namespace}.*"
-            keys_to_remove = [k for k in self._subscribers.keys() if fnmatch.fnmatch(k, pattern)]
-            for key in keys_to_remove:
+            # 按命名空间索引直接定位，O(命中数) 而非对全部键做 fnmatch 扫描
+            for key in self._by_namespace.pop(namespace, ()):
                 self._subscribers.pop(key, None)
-                self._subscriber_priority.pop(key, None)
                 self._once_subscribers.pop(key, None)
-            _WILDCARD_HANDLERS.clear()
-            _WILDCARD_HANDLER_FUNCTIONS.clear()
+            # 只移除落在该命名空间内的模式订阅，不相关的通配符保持不动
+            ns_prefix = namespace + "."
+            for pattern in [p for p in _WILDCARD_HANDLERS if p.startswith(ns_prefix)]:
+                del _WILDCARD_HANDLERS[pattern]
+                _WILDCARD_HANDLER_IDS.pop(pattern, None)
             logger.info(f"已清空命名空间 '{namespace}' 的所有事件订阅")
         else:
             self._subscribers.clear()
-            self._subscriber_priority.clear()
             self._once_subscribers.clear()
+            self._by_namespace.clear()
             _WILDCARD_HANDLERS.clear()
+            _WILDCARD_HANDLER_IDS.clear()
             _WILDCARD_HANDLER_FUNCTIONS.clear()
             logger.info("已清空所有事件订阅")
     
+    @property
+    def subscription_version(self) -> int:
+        """当前订阅结构版本号（随订阅/取消订阅单调递增）"""
+        return self._subscription_version
+
+    def get_handlers(self, event_type: EventType):
+        """返回可直接顺序调用的处理器元组，供高频派发方缓存
+
+        仅当该事件可以安全地绕过 publish 时返回元组：
+        存在通配符/一次性订阅、或有异步处理器时返回 None，
+        调用方应回退到 publish 走完整派发逻辑。
+        """
+        event_name = _name(event_type)
+        if _WILDCARD_HANDLERS or self._once_subscribers.get(event_name):
+            return None
+        handlers = self._sorted_handlers(event_name)
+        if any(_is_coro_handler(h) for h in handlers):
+            return None
+        return handlers
+
     def get_subscribers_count(self, event_type: EventType) -> int:
-        event_name = str(event_type)
+        event_name = _name(event_type)
         return len(self._subscribers.get(event_name, []))
 
 
@@ -293,11 +543,9 @@ def event(event_type: str, priority: int = EventPriority.NORMAL):
         
         full_event_type = event_type
         if _EVENT_NAMESPACE and not event_type.startswith(_EVENT_NAMESPACE + "."):
-            full_event_type = f"{_EVENT_NAMESPACE}.{event_type}"
+            full_event_type = sys.intern(f"{_EVENT_NAMESPACE}.{event_type}")
         
-        if full_event_type not in _EVENT_HANDLERS_REGISTRY:
-            _EVENT_HANDLERS_REGISTRY[full_event_type] = set()
-        _EVENT_HANDLERS_REGISTRY[full_event_type].add((wrapper, priority))
+        _EVENT_HANDLERS_REGISTRY.setdefault(full_event_type, []).append((wrapper, priority))
         logger.debug(f"[EVENT] 已注册事件处理器: {full_event_type} (优先级: {priority}) -> {func.__name__}")
         return wrapper
     return decorator
@@ -311,11 +559,9 @@ def event_once(event_type: str, priority: int = EventPriority.NORMAL):
         
         full_event_type = event_type
         if _EVENT_NAMESPACE and not event_type.startswith(_EVENT_NAMESPACE + "."):
-            full_event_type = f"{_EVENT_NAMESPACE}.{event_type}"
+            full_event_type = sys.intern(f"{_EVENT_NAMESPACE}.{event_type}")
         
-        if full_event_type not in _ONCE_HANDLERS_REGISTRY:
-            _ONCE_HANDLERS_REGISTRY[full_event_type] = set()
-        _ONCE_HANDLERS_REGISTRY[full_event_type].add((wrapper, priority))
+        _ONCE_HANDLERS_REGISTRY.setdefault(full_event_type, []).append((wrapper, priority))
         logger.debug(f"[EVENT] 已注册一次性事件处理器: {full_event_type} -> {func.__name__}")
         return wrapper
     return decorator
@@ -359,7 +605,7 @@ def emitter(event_type: str, priority: int = EventPriority.NORMAL):
         def wrapper(*args, **kwargs):
             full_event_type = event_type
             if _EVENT_NAMESPACE and not event_type.startswith(_EVENT_NAMESPACE + "."):
-                full_event_type = f"{_EVENT_NAMESPACE}.{event_type}"
+                full_event_type = sys.intern(f"{_EVENT_NAMESPACE}.{event_type}")
             
             event_bus.publish(full_event_type, *args, **kwargs)
             return func(*args, **kwargs)
@@ -370,7 +616,7 @@ def emitter(event_type: str, priority: int = EventPriority.NORMAL):
 def subscribe_dynamic(event_type: str, handler: Callable, priority: int = EventPriority.NORMAL):
     full_event_type = event_type
     if _EVENT_NAMESPACE and not event_type.startswith(_EVENT_NAMESPACE + "."):
-        full_event_type = f"{_EVENT_NAMESPACE}.{event_type}"
+        full_event_type = sys.intern(f"{_EVENT_NAMESPACE}.{event_type}")
     event_bus.subscribe(full_event_type, handler, priority)
 
 
@@ -381,72 +627,45 @@ def subscribe_pattern_dynamic(pattern: str, handler: Callable, priority: int = E
 def subscribe_once_dynamic(event_type: str, handler: Callable):
     full_event_type = event_type
     if _EVENT_NAMESPACE and not event_type.startswith(_EVENT_NAMESPACE + "."):
-        full_event_type = f"{_EVENT_NAMESPACE}.{event_type}"
+        full_event_type = sys.intern(f"{_EVENT_NAMESPACE}.{event_type}")
     event_bus.subscribe_once(full_event_type, handler)
 
 
+def _bind_to(handler: Callable, component_instance: Any, component_cls: type) -> Callable:
+    """把注册表中的函数绑定到组件实例；已绑定的方法原样返回"""
+    if inspect.ismethod(handler):
+        return handler
+    try:
+        return handler.__get__(component_instance, component_cls)
+    except (AttributeError, TypeError):
+        return handler
+
+
 def register_component_handlers(component_instance: Any):
+    component_cls = type(component_instance)
+
     for event_type, handlers in _EVENT_HANDLERS_REGISTRY.items():
         for handler, priority in handlers:
-            if inspect.ismethod(handler) and hasattr(handler, '__self__'):
-                event_bus.subscribe(event_type, handler, priority)
-            else:
-                try:
-                    bound_handler = handler.__get__(component_instance, type(component_instance))
-                    if inspect.ismethod(bound_handler) and hasattr(bound_handler, '__self__') and hasattr(handler, '__self__') and handler.__self__ is bound_handler.__self__:
-                        bound_handler = handler
-                except (AttributeError, TypeError):
-                    bound_handler = handler
-                event_bus.subscribe(event_type, bound_handler, priority)
+            event_bus.subscribe(event_type, _bind_to(handler, component_instance, component_cls), priority)
             logger.debug(f"[EVENT] 自动注册处理器: {event_type} -> {handler.__name__}")
-    
+
     for event_type, handlers in _ONCE_HANDLERS_REGISTRY.items():
         for handler, priority in handlers:
-            if inspect.ismethod(handler) and hasattr(handler, '__self__'):
-                event_bus.subscribe_once(event_type, handler)
-            else:
-                try:
-                    bound_handler = handler.__get__(component_instance, type(component_instance))
-                    if inspect.ismethod(bound_handler) and hasattr(bound_handler, '__self__') and hasattr(handler, '__self__') and handler.__self__ is bound_handler.__self__:
-                        bound_handler = handler
-                except (AttributeError, TypeError):
-                    bound_handler = handler
-                event_bus.subscribe_once(event_type, bound_handler)
+            event_bus.subscribe_once(event_type, _bind_to(handler, component_instance, component_cls))
             logger.debug(f"[EVENT] 自动注册一次性处理器: {event_type} -> {handler.__name__}")
-    
+
     for pattern, handlers in _WILDCARD_HANDLERS.items():
         for handler, priority in handlers:
-            if inspect.ismethod(handler) and hasattr(handler, '__self__'):
-                event_bus.subscribe_wildcard(handler, priority) if pattern == "*" else event_bus.subscribe_pattern(pattern, handler, priority)
+            bound_handler = _bind_to(handler, component_instance, component_cls)
+            if pattern == "*":
+                event_bus.subscribe_wildcard(bound_handler, priority)
             else:
-                try:
-                    bound_handler = handler.__get__(component_instance, type(component_instance))
-                    if inspect.ismethod(bound_handler) and hasattr(bound_handler, '__self__') and hasattr(handler, '__self__') and handler.__self__ is bound_handler.__self__:
-                        bound_handler = handler
-                except (AttributeError, TypeError):
-                    bound_handler = handler
-                logger.debug(f"[DEBUG] 绑定通配符处理器: original={handler}, bound={bound_handler}, pattern={pattern}")
-                
-                if pattern == "*":
-                    event_bus.subscribe_wildcard(bound_handler, priority)
-                else:
-                    event_bus.subscribe_pattern(pattern, bound_handler, priority)
+                event_bus.subscribe_pattern(pattern, bound_handler, priority)
             logger.debug(f"[EVENT] 自动注册模式处理器: {pattern} -> {handler.__name__}")
-    
+
     for handler in _WILDCARD_HANDLER_FUNCTIONS:
-        patterns = getattr(handler, '_event_patterns', [])
-        for pattern, priority in patterns:
-            if inspect.ismethod(handler) and hasattr(handler, '__self__'):
-                bound_handler = handler
-            else:
-                try:
-                    bound_handler = handler.__get__(component_instance, type(component_instance))
-                    if inspect.ismethod(bound_handler) and hasattr(bound_handler, '__self__') and hasattr(handler, '__self__') and handler.__self__ is bound_handler.__self__:
-                        bound_handler = handler
-                except (AttributeError, TypeError):
-                    bound_handler = handler
-            logger.debug(f"[DEBUG] 绑定通配符处理器(装饰器): original={handler}, bound={bound_handler}, pattern={pattern}")
-            
+        for pattern, priority in getattr(handler, '_event_patterns', ()):
+            bound_handler = _bind_to(handler, component_instance, component_cls)
             if pattern == "*":
                 event_bus.subscribe_wildcard(bound_handler, priority)
             else:
@@ -457,7 +676,7 @@ def register_component_handlers(component_instance: Any):
 def register_event_class(event_type: str, event_class: Type[BaseEvent]):
     full_event_type = event_type
     if _EVENT_NAMESPACE and not event_type.startswith(_EVENT_NAMESPACE + "."):
-        full_event_type = f"{_EVENT_NAMESPACE}.{event_type}"
+        full_event_type = sys.intern(f"{_EVENT_NAMESPACE}.{event_type}")
     event_bus.register_event_class(full_event_type, event_class)
 
 
@@ -5,22 +5,30 @@
 """
 
 import logging
+import threading
 from abc import ABCMeta
 from typing import Dict, Type, Any, Optional, Callable
 
 logger = logging.getLogger(__name__)
 
+_DI_LOCK = threading.Lock()
+
 
 class DIContainer:
     """轻量级依赖注入容器"""
-    
+
     _instance: Optional['DIContainer'] = None
-    
+
     def __new__(cls):
+        # 双重检查锁：快路径无锁；慢路径先把实例完整初始化再发布到类属性，
+        # 避免多线程启动时竞争出两个各自注册服务的容器
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._services: Dict[str, Any] = {}
-            cls._instance._singletons: Dict[str, Any] = {}
+            with _DI_LOCK:
+                if cls._instance is None:
+                    inst = super().__new__(cls)
+                    inst._services = {}
+                    inst._singletons = {}
+                    cls._instance = inst
         return cls._instance
     
     def register(self, service_type: Type, instance: Any = None, singleton: bool = True):
@@ -31,11 +39,10 @@ class DIContainer:
             instance: 可选，预配置实例
             singleton: 是否单例模式
         """
-        if isinstance(service_type, str):
-            key = service_type
-        else:
-            key = f"{service_type.__module__}.{service_type.__name__}"
-        
+        # 类型对象本身可哈希，直接作键：省去每次注册/解析的 f-string 拼接；
+        # 字符串别名同样直接作键
+        key = service_type
+
         if instance is not None:
             self._services[key] = (instance, singleton)
             if singleton:
@@ -52,8 +59,7 @@ class DIContainer:
             service_type: 服务类型
             factory: 创建实例的工厂函数
         """
-        key = f"{service_type.__module__}.{service_type.__name__}"
-        self._services[key] = (factory, False)
+        self._services[service_type] = (factory, False)
         logger.info(f"[DI] 已注册工厂: {service_type.__name__}")
     
     def resolve(self, service_type: Type) -> Any:
@@ -65,27 +71,33 @@ class DIContainer:
         Returns:
             Any: 服务实例
         """
-        if isinstance(service_type, str):
-            key = service_type
-        else:
-            key = f"{service_type.__module__}.{service_type.__name__}"
-        
+        key = service_type
+
+        # 单例已物化时一次查找直接命中（inject 描述符的每次属性访问都走这里）
+        cached = self._singletons.get(key)
+        if cached is not None:
+            return cached
+
         if key not in self._services:
             raise ValueError(f"[DI] 服务未注册: {key}")
-        
-        instance_or_factory, is_singleton = self._services[key]
-        
-        if is_singleton and key in self._singletons:
-            return self._singletons[key]
-        
-        if callable(instance_or_factory) and not isinstance(instance_or_factory, type):
-            instance = instance_or_factory()
-        else:
-            instance = instance_or_factory
-        
-        if is_singleton:
-            self._singletons[key] = instance
-        
+
+        # 单例物化加锁，防止并发首次解析时工厂被调用两次；
+        # 已命中缓存的快路径（上方）不经过锁
+        with _DI_LOCK:
+            cached = self._singletons.get(key)
+            if cached is not None:
+                return cached
+
+            instance_or_factory, is_singleton = self._services[key]
+
+            if callable(instance_or_factory) and not isinstance(instance_or_factory, type):
+                instance = instance_or_factory()
+            else:
+                instance = instance_or_factory
+
+            if is_singleton:
+                self._singletons[key] = instance
+
         return instance
     
     def clear(self):
@@ -94,6 +106,18 @@ class DIContainer:
         self._singletons.clear()
         logger.info("[DI] 容器已清空")
     
+    def is_singleton(self, service_type: Type) -> bool:
+        """检查服务是否以单例模式注册
+
+        Args:
+            service_type: 服务类型，或字符串别名
+
+        Returns:
+            bool: 是否单例
+        """
+        entry = self._services.get(service_type)
+        return entry is not None and entry[1]
+
     def has(self, service_type: Type) -> bool:
         """检查服务是否已注册
         
@@ -103,11 +127,7 @@ class DIContainer:
         Returns:
             bool: 是否已注册
         """
-        if isinstance(service_type, str):
-            key = service_type
-        else:
-            key = f"{service_type.__module__}.{service_type.__name__}"
-        return key in self._services
+        return service_type in self._services
 
 
 # 全局容器实例
@@ -122,14 +142,37 @@ def get_container() -> DIContainer:
     return _container
 
 
+class _InjectedDescriptor:
+    """注入描述符（非数据描述符）
+
+    首次访问时解析服务；单例服务的解析结果写入实例 __dict__，
+    实例字典会遮蔽非数据描述符，后续属性读取就是普通字典查找，
+    不再经过容器。非单例服务保持每次访问都解析的语义。
+    """
+
+    __slots__ = ('service_type', 'name')
+
+    def __init__(self, service_type: Type):
+        self.service_type = service_type
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        container = get_container()
+        value = container.resolve(self.service_type)
+        if self.name is not None and container.is_singleton(self.service_type):
+            obj.__dict__[self.name] = value
+        return value
+
+
 def inject(service_type: Type):
     """依赖注入装饰器"""
     def decorator(prop_func):
-        @property
-        def wrapper(self):
-            container = get_container()
-            return container.resolve(service_type)
-        return wrapper
+        return _InjectedDescriptor(service_type)
     return decorator
 
 
@@ -140,8 +183,7 @@ class AutoInjectMeta(ABCMeta):
         new_namespace = {}
         for key, value in namespace.items():
             if isinstance(value, _InjectMarker):
-                service_type = value.service_type
-                new_namespace[key] = property(lambda self, st=service_type: get_container().resolve(st))
+                new_namespace[key] = _InjectedDescriptor(value.service_type)
             else:
                 new_namespace[key] = value
         
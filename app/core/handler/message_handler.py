@@ -10,27 +10,48 @@
 
 """
 
-import json
 import logging
+import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 from ..bus.event_bus import event_bus
 from ..bus.events import EventType
 from ..bus.event_models import AlertEvent, JsQueryEvent
-from ..handler.title_bar_handler import TitleBarHandler
+from ..handler.title_bar_handler import get_titlebar_handler
 from ..interface.icell import ICell
 from ..util.components_loader import get_cell as get_cell_from_registry, register_cell as register_cell_to_global
 
 logger = logging.getLogger(__name__)
 
+# orjson 解析小 JSON 消息约快 3 倍；未安装时退回标准库，
+# 两者的 JSONDecodeError 都是 ValueError 子类，异常处理统一按 ValueError 捕获
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+_loads = _json.loads
+
 _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cell-")
+# 在途异步任务上限：JS 侧疯狂提交时丢弃新任务并告警，
+# 避免线程池内部队列无界膨胀
+_pending_slots = threading.BoundedSemaphore(64)
+
+
+def _log_async_exc(future):
+    """异步任务完成回调：把未被 run() 捕获的异常送进日志，不再静默丢弃"""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("异步任务异常: %s", exc)
 
 
 class MessageHandler:
     def __init__(self, hwnd, calculator=None):
         self.hwnd = hwnd
         self.calculator = calculator
-        self._titlebar_handler = TitleBarHandler(hwnd)
+        # 复用 TitleBarCell 单例的处理器，同时把它注册进组件注册表，
+        # titlebar 命令由统一的组件分发路径处理
+        self._titlebar_handler = get_titlebar_handler(hwnd).get_handler()
         
         event_bus.subscribe(EventType.ALERT, self._on_alert_message)
         event_bus.subscribe(EventType.JSQUERY, self._on_jsquery_message)
@@ -51,19 +72,15 @@ class MessageHandler:
             tuple: (组件名, 命令, 参数字符串)
             解析失败返回 (None, None, None)
         """
-        try:
-            parts = command.split(':', 2)
-            if len(parts) < 2:
-                return (None, None, None)
-            
-            cell_name = parts[0]
-            cmd = parts[1]
-            args = parts[2] if len(parts) > 2 else ''
-            
-            return (cell_name, cmd, args)
-        except Exception as e:
-            logger.error(f"解析命令失败: {command}, 错误: {e}")
+        # partition 返回定长三元组，不分配列表；对 str 不会抛异常，
+        # 原先的 try/except 是死分支，白付帧开销
+        head, sep, rest = command.partition(':')
+        if not sep:
             return (None, None, None)
+
+        cmd, _, args = rest.partition(':')
+        # 组件名基数很小，驻留后注册表查找命中指针比较快路径
+        return (sys.intern(head), cmd, args)
     
     def _parse_args(self, args: str) -> Any:
         """参数解析
@@ -84,11 +101,11 @@ class MessageHandler:
         
         if args.startswith(('{', '[')):
             try:
-                return json.loads(args)
-            except json.JSONDecodeError:
-                logger.debug(f"JSON 解析失败，保持原字符串: {args}")
+                return _loads(args)
+            except ValueError:
+                logger.debug("JSON 解析失败，保持原字符串: %s", args)
                 return args
-        
+
         return args
     
     def _handle_cell_command(self, command: str, async_exec: bool = False) -> Any:
@@ -108,54 +125,52 @@ class MessageHandler:
             命令执行结果
         """
         cell_name, cmd, args_str = self._parse_cell_command(command)
-        
+
         if not cell_name:
-            logger.warning(f"无法解析命令: {command}")
+            logger.warning("无法解析命令: %s", command)
             return "Error: Invalid command format"
-        
+
+        return self._handle_parsed(cell_name, cmd, args_str, async_exec)
+
+    def _handle_parsed(self, cell_name: str, cmd: str, args_str: str, async_exec: bool = False) -> Any:
+        """处理已解析的组件命令（供已调用过 _parse_cell_command 的路径复用）"""
         cell = self.get_cell(cell_name)
         if not cell:
-            if cell_name == "titlebar":
-                return self._handle_titlebar_command(cmd, args_str)
-            logger.warning(f"组件不存在: {cell_name}")
+            logger.warning("组件不存在: %s", cell_name)
             return f"Error: Cell '{cell_name}' not found"
-        
+
         args = self._parse_args(args_str)
-        
-        logger.info(f"执行命令: {cell_name}:{cmd}:{args_str}")
-        
+
+        logger.debug("执行命令: %s:%s:%s", cell_name, cmd, args_str)
+
         if async_exec:
             return self._execute_async(cell, cmd, args)
-        
+
         try:
             return cell.execute(cmd, args)
         except Exception as e:
-            logger.error(f"命令执行失败: {cell_name}:{cmd}, 错误: {e}")
+            logger.error("命令执行失败: %s:%s, 错误: %s", cell_name, cmd, e)
             return f"Error: {str(e)}"
     
     def _execute_async(self, cell: ICell, cmd: str, args: Any) -> str:
-        """异步执行组件命令（提交到线程池）"""
+        """异步执行组件命令（提交到线程池，在途任务有上限）"""
+        if not _pending_slots.acquire(blocking=False):
+            logger.warning("异步任务队列已满，丢弃命令: %s:%s", cell.cell_name, cmd)
+            return "Error: Task queue full"
+
         def run():
             try:
                 return cell.execute(cmd, args)
             except Exception as e:
-                logger.error(f"异步命令执行失败: {cell.cell_name}:{cmd}, 错误: {e}")
+                logger.error("异步命令执行失败: %s:%s, 错误: %s", cell.cell_name, cmd, e)
                 return f"Error: {str(e)}"
-        
+            finally:
+                _pending_slots.release()
+
         future = _executor.submit(run)
+        future.add_done_callback(_log_async_exc)
         return "Task submitted to thread pool"
     
-    def _handle_titlebar_command(self, cmd: str, args: str) -> str:
-        """处理标题栏命令"""
-        try:
-            result = self._titlebar_handler.execute(cmd, args)
-            if result and isinstance(result, str) and result.startswith("Error"):
-                logger.warning(f"标题栏命令执行失败: {cmd}, {result}")
-            return result if result else "OK"
-        except Exception as e:
-            logger.error(f"执行标题栏命令失败: {cmd}, 错误: {e}")
-            return f"Error: {str(e)}"
-    
     def _on_alert_message(self, event: AlertEvent):
         """处理 Alert 消息"""
         msg_str = event.message
@@ -164,7 +179,7 @@ class MessageHandler:
             self._handle_calc_result(result)
         elif msg_str and ':' in msg_str:
             result = self._handle_cell_command(msg_str)
-            logger.info(f"[INFO] 命令执行结果: {result}")
+            logger.debug("[INFO] 命令执行结果: %s", result)
         elif msg_str:
             self._on_python_command(msg_str)
     
@@ -185,13 +200,14 @@ class MessageHandler:
         
         优先使用统一命令格式：组件名:命令:参数
         """
-        logger.info(f"[INFO] 收到 Python 命令: {command}")
+        logger.debug("[INFO] 收到 Python 命令: %s", command)
         
         if ':' in command:
-            cell_name, cmd, args = self._parse_cell_command(command)
+            # 解析一次后直接走 _handle_parsed，不再让 _handle_cell_command 重复切分
+            cell_name, cmd, args_str = self._parse_cell_command(command)
             if cell_name and self.get_cell(cell_name):
-                result = self._handle_cell_command(command)
-                logger.info(f"[INFO] 命令执行结果: {result}")
+                result = self._handle_parsed(cell_name, cmd, args_str)
+                logger.debug("[INFO] 命令执行结果: %s", result)
                 return
         
         if command.startswith("calc:"):
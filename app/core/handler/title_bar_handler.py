@@ -26,6 +26,8 @@
 
 import ctypes
 import logging
+import threading
+from ctypes import wintypes
 from typing import Optional, Callable, Any
 from ..bus.event_bus import event_bus, event
 from ..bus.events import EventType
@@ -47,6 +49,58 @@ class WINDOWPLACEMENT(ctypes.Structure):
     ]
 
 
+class FLASHWINFO(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", ctypes.c_uint),
+        ("hwnd", ctypes.c_void_p),
+        ("dwFlags", ctypes.c_uint),
+        ("uCount", ctypes.c_uint),
+        ("dwTimeout", ctypes.c_uint),
+    ]
+
+
+# 结构体大小在导入时算一次，免去每次窗口操作的 ctypes.sizeof 调用
+_WP_SIZE = ctypes.sizeof(WINDOWPLACEMENT)
+_FI_SIZE = ctypes.sizeof(FLASHWINFO)
+
+# FlashWindowEx 标志位
+FLASHW_STOP = 0
+FLASHW_CAPTION = 1
+FLASHW_TRAY = 2
+FLASHW_ALL = 3
+FLASHW_TIMER = 4
+FLASHW_TIMERNOFG = 12
+
+# 导入时一次性声明 argtypes/restype，跳过 ctypes 每次调用的参数类型猜测
+_USER32_PROTOTYPES = {
+    'ShowWindow': ([wintypes.HWND, ctypes.c_int], wintypes.BOOL),
+    'DestroyWindow': ([wintypes.HWND], wintypes.BOOL),
+    'SetForegroundWindow': ([wintypes.HWND], wintypes.BOOL),
+    'SetWindowTextW': ([wintypes.HWND, wintypes.LPCWSTR], wintypes.BOOL),
+    'GetWindowTextLengthW': ([wintypes.HWND], ctypes.c_int),
+    'GetWindowTextW': ([wintypes.HWND, wintypes.LPWSTR, ctypes.c_int], ctypes.c_int),
+    'ReleaseCapture': ([], wintypes.BOOL),
+    'SendMessageW': ([wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM], ctypes.c_ssize_t),
+    'FlashWindowEx': ([ctypes.POINTER(FLASHWINFO)], wintypes.BOOL),
+    'SetWindowPos': ([wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                      ctypes.c_int, ctypes.c_int, wintypes.UINT], wintypes.BOOL),
+    'GetWindowPlacement': ([wintypes.HWND, ctypes.POINTER(WINDOWPLACEMENT)], wintypes.BOOL),
+    'GetSystemMetrics': ([ctypes.c_int], ctypes.c_int),
+    'GetWindowRect': ([wintypes.HWND, ctypes.POINTER(wintypes.RECT)], wintypes.BOOL),
+}
+for _fn_name, (_argtypes, _restype) in _USER32_PROTOTYPES.items():
+    _fn = getattr(user32, _fn_name)
+    _fn.argtypes = _argtypes
+    _fn.restype = _restype
+
+# 模块级绑定函数对象，热路径不再走 WinDLL.__getattr__
+_ShowWindow = user32.ShowWindow
+_SendMessageW = user32.SendMessageW
+_ReleaseCapture = user32.ReleaseCapture
+_SetWindowPos = user32.SetWindowPos
+_GetWindowPlacement = user32.GetWindowPlacement
+
+
 class TitleBarHandler:
     """标题栏处理器 - 封装窗口控制操作"""
     
@@ -59,61 +113,64 @@ class TitleBarHandler:
         self.hwnd = hwnd
         self._is_maximized = False
         self._always_on_top = False
-        logger.info(f"标题栏处理器已初始化，HWND: {hwnd}")
+        # 复用的 WINDOWPLACEMENT 缓冲区：GetWindowPlacement 只在
+        # MiniBlink UI 线程上调用，单实例反复填充即可，不必每次新建
+        self._placement = WINDOWPLACEMENT()
+        logger.info("标题栏处理器已初始化，HWND: %s", hwnd)
     
     def minimize(self) -> str:
         """最小化窗口"""
         try:
-            user32.ShowWindow(self.hwnd, 2)
+            _ShowWindow(self.hwnd, 2)
             logger.info("窗口已最小化")
             return "OK"
         except Exception as e:
-            logger.error(f"最小化窗口失败: {e}")
+            logger.error("最小化窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def maximize(self) -> str:
         """最大化窗口"""
         try:
-            user32.ShowWindow(self.hwnd, 3)
+            _ShowWindow(self.hwnd, 3)
             self._is_maximized = True
             logger.info("窗口已最大化")
             return "OK"
         except Exception as e:
-            logger.error(f"最大化窗口失败: {e}")
+            logger.error("最大化窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def restore(self) -> str:
         """还原窗口"""
         try:
-            user32.ShowWindow(self.hwnd, 9)
+            _ShowWindow(self.hwnd, 9)
             self._is_maximized = False
             logger.info("窗口已还原")
             return "OK"
         except Exception as e:
-            logger.error(f"还原窗口失败: {e}")
+            logger.error("还原窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def toggle_maximize(self) -> str:
         """切换最大化/还原状态"""
         try:
-            placement = WINDOWPLACEMENT()
-            placement.length = ctypes.sizeof(WINDOWPLACEMENT)
-            user32.GetWindowPlacement(self.hwnd, byref(placement))
-            
+            placement = self._placement
+            placement.length = _WP_SIZE
+            _GetWindowPlacement(self.hwnd, byref(placement))
+
             show_cmd = placement.showCmd
             is_currently_maximized = (show_cmd == 3)
             
             if is_currently_maximized:
                 self._is_maximized = False
-                user32.ShowWindow(self.hwnd, 9)
+                _ShowWindow(self.hwnd, 9)
                 logger.info("窗口已还原")
             else:
                 self._is_maximized = True
-                user32.ShowWindow(self.hwnd, 3)
+                _ShowWindow(self.hwnd, 3)
                 logger.info("窗口已最大化")
             return "OK"
         except Exception as e:
-            logger.error(f"切换窗口状态失败: {e}")
+            logger.error("切换窗口状态失败: %s", e)
             return f"Error: {str(e)}"
     
     def close(self, force: bool = False) -> str:
@@ -131,28 +188,28 @@ class TitleBarHandler:
                 logger.info("触发窗口关闭动画")
             return "OK"
         except Exception as e:
-            logger.error(f"关闭窗口失败: {e}")
+            logger.error("关闭窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def show(self) -> str:
         """显示窗口"""
         try:
-            user32.ShowWindow(self.hwnd, 5)
+            _ShowWindow(self.hwnd, 5)
             user32.SetForegroundWindow(self.hwnd)
             logger.info("窗口已显示")
             return "OK"
         except Exception as e:
-            logger.error("显示窗口失败: {e}")
+            logger.error("显示窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def hide(self) -> str:
         """隐藏窗口"""
         try:
-            user32.ShowWindow(self.hwnd, 0)
+            _ShowWindow(self.hwnd, 0)
             logger.info("窗口已隐藏")
             return "OK"
         except Exception as e:
-            logger.error(f"隐藏窗口失败: {e}")
+            logger.error("隐藏窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def set_title(self, title: str) -> str:
@@ -163,10 +220,10 @@ class TitleBarHandler:
         """
         try:
             user32.SetWindowTextW(self.hwnd, title)
-            logger.info(f"窗口标题已设置为: {title}")
+            logger.info("窗口标题已设置为: %s", title)
             return "OK"
         except Exception as e:
-            logger.error(f"设置窗口标题失败: {e}")
+            logger.error("设置窗口标题失败: %s", e)
             return f"Error: {str(e)}"
     
     def get_title(self) -> str:
@@ -179,7 +236,7 @@ class TitleBarHandler:
                 return buffer.value
             return ""
         except Exception as e:
-            logger.error(f"获取窗口标题失败: {e}")
+            logger.error("获取窗口标题失败: %s", e)
             return ""
     
     def start_drag(self) -> str:
@@ -188,12 +245,12 @@ class TitleBarHandler:
         用于前端自定义拖动区域，在 mousedown 时调用
         """
         try:
-            user32.ReleaseCapture()
-            user32.SendMessageW(self.hwnd, 0xA1, 2, 0)
-            logger.info("开始拖动窗口")
+            _ReleaseCapture()
+            _SendMessageW(self.hwnd, 0xA1, 2, 0)
+            logger.debug("开始拖动窗口")
             return "OK"
         except Exception as e:
-            logger.error(f"拖动窗口失败: {e}")
+            logger.error("拖动窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def flash(self, invert: bool = False) -> str:
@@ -203,26 +260,10 @@ class TitleBarHandler:
             invert: 是否反色闪烁
         """
         try:
-            FLASHW_STOP = 0
-            FLASHW_CAPTION = 1
-            FLASHW_TRAY = 2
-            FLASHW_ALL = 3
-            FLASHW_TIMER = 4
-            FLASHW_TIMERNOFG = 12
-            
             count = 5 if not invert else 1
-            
-            class FLASHWINFO(ctypes.Structure):
-                _fields_ = [
-                    ("cbSize", ctypes.c_uint),
-                    ("hwnd", ctypes.c_void_p),
-                    ("dwFlags", ctypes.c_uint),
-                    ("uCount", ctypes.c_uint),
-                    ("dwTimeout", ctypes.c_uint),
-                ]
-            
+
             info = FLASHWINFO()
-            info.cbSize = ctypes.sizeof(FLASHWINFO)
+            info.cbSize = _FI_SIZE
             info.hwnd = self.hwnd
             info.dwFlags = FLASHW_ALL | FLASHW_TIMER
             info.uCount = count
@@ -232,7 +273,7 @@ class TitleBarHandler:
             logger.info("窗口已闪烁")
             return "OK"
         except Exception as e:
-            logger.error(f"闪烁窗口失败: {e}")
+            logger.error("闪烁窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def set_always_on_top(self, enable: bool) -> str:
@@ -249,15 +290,15 @@ class TitleBarHandler:
             SWP_SHOWWINDOW = 0x0040
             
             hwnd_insert = HWND_TOPMOST if enable else HWND_NOTOPMOST
-            user32.SetWindowPos(self.hwnd, hwnd_insert, 0, 0, 0, 0,
+            _SetWindowPos(self.hwnd, hwnd_insert, 0, 0, 0, 0,
                               SWP_NOSIZE | SWP_NOMOVE | SWP_SHOWWINDOW)
             
             self._always_on_top = enable
             status = "置顶" if enable else "取消置顶"
-            logger.info(f"窗口已{status}")
+            logger.info("窗口已%s", status)
             return "OK"
         except Exception as e:
-            logger.error(f"设置置顶状态失败: {e}")
+            logger.error("设置置顶状态失败: %s", e)
             return f"Error: {str(e)}"
     
     def get_state(self) -> dict:
@@ -267,10 +308,10 @@ class TitleBarHandler:
             dict: 包含窗口状态的字典
         """
         try:
-            placement = WINDOWPLACEMENT()
-            placement.length = ctypes.sizeof(WINDOWPLACEMENT)
-            user32.GetWindowPlacement(self.hwnd, byref(placement))
-            
+            placement = self._placement
+            placement.length = _WP_SIZE
+            _GetWindowPlacement(self.hwnd, byref(placement))
+
             show_cmd = placement.showCmd
             state = "normal"
             if show_cmd == 2:
@@ -288,7 +329,7 @@ class TitleBarHandler:
                 "title": self.get_title()
             }
         except Exception as e:
-            logger.error(f"获取窗口状态失败: {e}")
+            logger.error("获取窗口状态失败: %s", e)
             return {"state": "error", "error": str(e)}
     
     def resize(self, width: int, height: int) -> str:
@@ -303,12 +344,12 @@ class TitleBarHandler:
             SWP_NOZORDER = 0x0004
             SWP_FRAMECHANGED = 0x0020
             
-            user32.SetWindowPos(self.hwnd, None, 0, 0, width, height,
+            _SetWindowPos(self.hwnd, None, 0, 0, width, height,
                               SWP_NOMOVE | SWP_NOZORDER | SWP_FRAMECHANGED)
-            logger.info(f"窗口大小已调整为: {width}x{height}")
+            logger.debug("窗口大小已调整为: %dx%d", width, height)
             return "OK"
         except Exception as e:
-            logger.error(f"调整窗口大小失败: {e}")
+            logger.error("调整窗口大小失败: %s", e)
             return f"Error: {str(e)}"
     
     def move(self, x: int, y: int) -> str:
@@ -323,12 +364,12 @@ class TitleBarHandler:
             SWP_NOZORDER = 0x0004
             SWP_FRAMECHANGED = 0x0020
             
-            user32.SetWindowPos(self.hwnd, None, x, y, 0, 0,
+            _SetWindowPos(self.hwnd, None, x, y, 0, 0,
                               SWP_NOSIZE | SWP_NOZORDER | SWP_FRAMECHANGED)
-            logger.info(f"窗口位置已移动到: ({x}, {y})")
+            logger.debug("窗口位置已移动到: (%d, %d)", x, y)
             return "OK"
         except Exception as e:
-            logger.error(f"移动窗口失败: {e}")
+            logger.error("移动窗口失败: %s", e)
             return f"Error: {str(e)}"
     
     def center(self) -> str:
@@ -348,60 +389,46 @@ class TitleBarHandler:
             
             return self.move(x, y)
         except Exception as e:
-            logger.error(f"窗口居中失败: {e}")
+            logger.error("窗口居中失败: %s", e)
             return f"Error: {str(e)}"
     
+    # 命令分发表：命令名 -> 带参数适配的调用器，
+    # execute 热路径只剩一次字典查找 + 一次调用，不再逐个字符串比较
+    _DISPATCH = {
+        "minimize": lambda self, *a: self.minimize(),
+        "maximize": lambda self, *a: self.maximize(),
+        "restore": lambda self, *a: self.restore(),
+        "toggle": lambda self, *a: self.toggle_maximize(),
+        "close": lambda self, *a: self.close(),
+        "show": lambda self, *a: self.show(),
+        "hide": lambda self, *a: self.hide(),
+        "setTitle": lambda self, *a: self.set_title(a[0] if a else ""),
+        "startDrag": lambda self, *a: self.start_drag(),
+        "flash": lambda self, *a: self.flash(),
+        "setAlwaysOnTop": lambda self, *a: self.set_always_on_top(a[0].lower() == "true" if a else True),
+        "getState": lambda self, *a: self.get_state(),
+        "resize": lambda self, *a: self.resize(int(a[0]) if a else 800, int(a[1]) if len(a) > 1 else 600),
+        "move": lambda self, *a: self.move(int(a[0]) if a else 0, int(a[1]) if len(a) > 1 else 0),
+        "center": lambda self, *a: self.center(),
+    }
+
     def execute(self, command: str, *args) -> Any:
         """执行命令
-        
+
         用于 ICell 接口兼容
-        
+
         Args:
             command: 命令名称
             args: 命令参数
-            
+
         Returns:
             命令执行结果
         """
-        if command == "minimize":
-            return self.minimize()
-        elif command == "maximize":
-            return self.maximize()
-        elif command == "restore":
-            return self.restore()
-        elif command == "toggle":
-            return self.toggle_maximize()
-        elif command == "close":
-            return self.close()
-        elif command == "show":
-            return self.show()
-        elif command == "hide":
-            return self.hide()
-        elif command == "setTitle":
-            title = args[0] if args else ""
-            return self.set_title(title)
-        elif command == "startDrag":
-            return self.start_drag()
-        elif command == "flash":
-            return self.flash()
-        elif command == "setAlwaysOnTop":
-            enable = args[0].lower() == "true" if args else True
-            return self.set_always_on_top(enable)
-        elif command == "getState":
-            return self.get_state()
-        elif command == "resize":
-            width = int(args[0]) if args else 800
-            height = int(args[1]) if len(args) > 1 else 600
-            return self.resize(width, height)
-        elif command == "move":
-            x = int(args[0]) if args else 0
-            y = int(args[1]) if len(args) > 1 else 0
-            return self.move(x, y)
-        elif command == "center":
-            return self.center()
-        else:
-            logger.warning(f"未知命令: {command}")
+        handler = self._DISPATCH.get(command)
+        if handler is None:
+            logger.warning("未知命令: %s", command)
             return f"Error: Unknown command '{command}'"
+        return handler(self, *args)
 
 
 class TitleBarCell(ICell):
@@ -412,7 +439,16 @@ class TitleBarCell(ICell):
         self.name = "titlebar"
         self.handler = TitleBarHandler(hwnd)
         logger.info("标题栏组件已初始化")
-    
+
+    @property
+    def cell_name(self) -> str:
+        return "titlebar"
+
+    def get_commands(self) -> dict:
+        """获取可用命令列表"""
+        return {name: name for name in TitleBarHandler._DISPATCH}
+
+
     @event("titlebar.minimize")
     def on_minimize(self):
         """监听最小化事件"""
@@ -438,11 +474,21 @@ class TitleBarCell(ICell):
 
 
 _handler_instance: Optional[TitleBarCell] = None
+_handler_lock = threading.Lock()
 
 
 def get_titlebar_handler(hwnd: int) -> TitleBarCell:
-    """获取标题栏处理器实例"""
+    """获取标题栏处理器实例（懒初始化，双重检查锁）
+
+    首次创建时同时注册进全局组件注册表，
+    让 titlebar 命令走统一的组件分发路径。
+    """
     global _handler_instance
     if _handler_instance is None:
-        _handler_instance = TitleBarCell(hwnd)
+        with _handler_lock:
+            if _handler_instance is None:
+                from ..util.components_loader import register_cell
+                cell = TitleBarCell(hwnd)
+                register_cell(cell)
+                _handler_instance = cell
     return _handler_instance
@@ -1,4 +1,6 @@
 import importlib
+import importlib.util
+import json
 import logging
 import os
 import pathlib
@@ -10,6 +12,13 @@ try:
 except ImportError:
     yaml = None
 
+# 优先用 libyaml 的 C 解析器；PyYAML 未带 C 扩展时退回纯 Python SafeLoader
+if yaml is not None:
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+
 from app.core.di.container import DIContainer
 from app.core.interface.icell import ICell
 
@@ -24,9 +33,14 @@ def get_all_cells() -> Dict[str, ICell]:
 
 
 def register_cell(cell: ICell):
-    """注册组件到全局注册表"""
-    _cell_registry[cell.cell_name] = cell
-    logger.info(f"组件已注册: {cell.cell_name}")
+    """注册组件到全局注册表
+
+    键经 sys.intern 驻留，与消息解析端驻留后的组件名做字典查找时
+    先走指针比较，免去逐字符比较。
+    """
+    name = sys.intern(cell.cell_name)
+    _cell_registry[name] = cell
+    logger.info(f"组件已注册: {name}")
 
 
 def get_cell(name: str) -> Optional[ICell]:
@@ -54,35 +68,64 @@ def get_config_path() -> pathlib.Path:
 
 
 def load_component_config(config_path: pathlib.Path) -> Dict[str, Any]:
-    """加载组件配置文件"""
+    """加载组件配置文件
+
+    YAML 解析成功后在旁边写一份 settings.json 缓存；
+    只要缓存不比 YAML 旧，下次冷启动直接走 C 实现的 json 解析，
+    完全跳过 YAML 词法分析。
+    """
     if not config_path.exists():
         logger.warning(f"配置文件不存在: {config_path}")
         return {"enabled_components": []}
-    
+
+    json_cache = config_path.with_suffix('.json')
+    try:
+        if json_cache.exists() and json_cache.stat().st_mtime >= config_path.stat().st_mtime:
+            return json.loads(json_cache.read_bytes())
+    except (OSError, ValueError):
+        pass  # 缓存缺失或损坏，走正常 YAML 路径重建
+
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
             content = f.read()
-            
+
             if not yaml:
                 logger.error("PyYAML 未安装，无法解析配置文件")
                 return {"enabled_components": []}
-            
-            config = yaml.safe_load(content)
-            return config or {"enabled_components": []}
-            
+
+            config = yaml.load(content, Loader=_YamlLoader) or {"enabled_components": []}
+
+            try:
+                json_cache.write_text(json.dumps(config, ensure_ascii=False), encoding='utf-8')
+            except (OSError, TypeError):
+                pass  # 目录只读或配置含非 JSON 类型时放弃缓存，不影响加载
+
+            return config
+
     except Exception as e:
         logger.error(f"加载配置文件失败: {e}")
         return {"enabled_components": []}
 
 
-def dynamic_import(module_path: str) -> Any:
-    """动态导入模块"""
+def dynamic_import(module_path: str, module_cache: Optional[Dict[str, Any]] = None) -> Any:
+    """动态导入模块
+
+    Args:
+        module_path: 模块路径（module.ClassName 形式）
+        module_cache: 可选的模块缓存，同一模块多个组件时只解析一次
+    """
     parts = module_path.rsplit('.', 1)
     if len(parts) != 2:
         raise ValueError(f"无效的模块路径: {module_path}")
-    
+
     module_name, class_name = parts
-    module = importlib.import_module(module_name)
+    if module_cache is not None:
+        module = module_cache.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
+            module_cache[module_name] = module
+    else:
+        module = importlib.import_module(module_name)
     return getattr(module, class_name)
 
 
@@ -108,12 +151,25 @@ def load_components(container: DIContainer, debug: bool = False) -> Dict[str, An
     
     component_list = config.get("enabled_components", [])
     loaded_components = {}
-    
+    module_cache: Dict[str, Any] = {}
+
     logger.info(f"开始加载组件，共 {len(component_list)} 个配置项")
-    
+
     for component_path in component_list:
+        # find_spec 先探一次：缺失的模块直接跳过，
+        # 不走代价高的异常驱动控制流（抛 ImportError 再被外层捕获）
+        module_name = component_path.rsplit('.', 1)[0]
+        if module_name not in module_cache:
+            try:
+                spec = importlib.util.find_spec(module_name)
+            except (ImportError, ValueError):
+                spec = None
+            if spec is None:
+                logger.error(f"组件模块不存在: {module_name}")
+                continue
+
         try:
-            component_class = dynamic_import(component_path)
+            component_class = dynamic_import(component_path, module_cache)
             instance = component_class()
             component_name = component_class.__name__
             
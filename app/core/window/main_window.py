@@ -4,30 +4,104 @@ Miniblink 浏览器 - 主窗口
 """
 
 import ctypes
+import functools
+import gzip
+import hashlib
 import http.server
 import logging
 import mimetypes
 import os
 import pathlib
-import random
+import re
 import socket
-import socketserver
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import wintypes, byref
 
 logger = logging.getLogger(__name__)
 
+# brotli 压缩比优于 gzip，但属于可选依赖；未安装时只提供 gzip 变体
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 值得预压缩的文本类资源；图片/字体等本身已压缩，再压只浪费 CPU
+_COMPRESSIBLE_TYPES = (
+    'text/', 'application/javascript', 'application/json',
+    'image/svg+xml', 'application/wasm',
+)
+
+# 文件名里带内容指纹（连续 8 位以上十六进制）的资源视为永不变更
+_HASHED_ASSET_RE = re.compile(r'[0-9a-f]{8,}')
+
+# MIME 注册在模块导入期做一次：mimetypes.init() 要解析系统映射文件，
+# 没必要每次 start() 重复付这笔 I/O
+mimetypes.init()
+for _ext, _type in (
+    ('.js', 'application/javascript'),
+    ('.css', 'text/css'),
+    ('.json', 'application/json'),
+    ('.svg', 'image/svg+xml'),
+    ('.wasm', 'application/wasm'),
+):
+    mimetypes.add_type(_type, _ext)
+del _ext, _type
+
 user32 = ctypes.windll.user32
 kernel32 = ctypes.windll.kernel32
-
-user32.SetLayeredWindowAttributes.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_ubyte, ctypes.c_uint]
-user32.SetLayeredWindowAttributes.restype = ctypes.c_bool
+winmm = ctypes.windll.winmm
+shell32 = ctypes.windll.shell32
+
+# 用到的 user32 函数在导入时统一声明 argtypes/restype：
+# 不声明时 ctypes 每次调用都按通用路径逐参推断转换方式，
+# 参数越多越吃亏；x64 上 LONG_PTR/LRESULT 对应 c_ssize_t
+_LRESULT = ctypes.c_ssize_t
+_USER32_PROTOTYPES = {
+    'SetLayeredWindowAttributes': ([ctypes.c_void_p, ctypes.c_uint, ctypes.c_ubyte, ctypes.c_uint], ctypes.c_bool),
+    'AnimateWindow': ([wintypes.HWND, wintypes.DWORD, wintypes.DWORD], wintypes.BOOL),
+    'GetWindowLongPtrW': ([wintypes.HWND, ctypes.c_int], _LRESULT),
+    'SetWindowLongPtrW': ([wintypes.HWND, ctypes.c_int, ctypes.c_void_p], _LRESULT),
+    'SetWindowPos': ([wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                      ctypes.c_int, ctypes.c_int, wintypes.UINT], wintypes.BOOL),
+    'ShowWindow': ([wintypes.HWND, ctypes.c_int], wintypes.BOOL),
+    'SetForegroundWindow': ([wintypes.HWND], wintypes.BOOL),
+    'SetWindowTextW': ([wintypes.HWND, wintypes.LPCWSTR], wintypes.BOOL),
+    'LoadImageW': ([wintypes.HINSTANCE, wintypes.LPCWSTR, wintypes.UINT,
+                    ctypes.c_int, ctypes.c_int, wintypes.UINT], wintypes.HANDLE),
+    'SendMessageW': ([wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM], _LRESULT),
+    'DefWindowProcW': ([wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM], _LRESULT),
+    'PostQuitMessage': ([ctypes.c_int], None),
+    'TranslateMessage': ([ctypes.c_void_p], wintypes.BOOL),
+    'DispatchMessageW': ([ctypes.c_void_p], _LRESULT),
+    'PeekMessageW': ([ctypes.c_void_p, wintypes.HWND, wintypes.UINT,
+                      wintypes.UINT, wintypes.UINT], wintypes.BOOL),
+    'MsgWaitForMultipleObjectsEx': ([wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD,
+                                     wintypes.DWORD, wintypes.DWORD], wintypes.DWORD),
+}
+for _name, (_argtypes, _restype) in _USER32_PROTOTYPES.items():
+    _func = getattr(user32, _name)
+    _func.argtypes = _argtypes
+    _func.restype = _restype
+del _name, _argtypes, _restype, _func
+
+shell32.SetCurrentProcessExplicitAppUserModelIDW.argtypes = [wintypes.LPCWSTR]
+shell32.SetCurrentProcessExplicitAppUserModelIDW.restype = ctypes.c_long
+
+# 窗口过程 thunk 的类型：注册进 GWLP_WNDPROC 的回调必须在窗口整个
+# 生命周期内持有引用——libffi 闭包一旦被 GC，下一条消息就会崩溃
+_WNDPROC_TYPE = ctypes.WINFUNCTYPE(
+    _LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+)
 
 LWA_ALPHA = 0x00000002
 LWA_COLORKEY = 0x00000001
 
+AW_HIDE = 0x00010000
+AW_BLEND = 0x00080000
+
 from ..bridge.miniblink_bridge import MiniBlinkBridge
 from ..bus.event_bus import event_bus
 from ..bus.events import EventType
@@ -37,7 +111,13 @@ from ..di.container import get_container
 
 WM_COMMAND = 0x0111
 WM_CLOSE = 0x10
+WM_QUIT = 0x0012
 WM_SYSCOMMAND = 0x112
+
+PM_REMOVE = 0x0001
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+INFINITE = 0xFFFFFFFF
 SC_MINIMIZE = 0xF020
 SC_MAXIMIZE = 0xF030
 SC_RESTORE = 0xF120
@@ -45,6 +125,9 @@ SC_CLOSE = 0xF060
 
 BN_CLICKED = 0
 
+# 约定：结构体只作为出入参传递、C 侧不保留指针时一律用 byref()，
+# 不用 pointer()——byref 不分配 LP_* 包装对象，快 2~3 倍；
+# 只有需要把指针对象存起来反复传递时才用 pointer()
 class POINT(ctypes.Structure):
     _fields_ = [
         ("x", ctypes.c_long),
@@ -69,8 +152,13 @@ class WINDOWPLACEMENT(ctypes.Structure):
         ("rcNormalPosition", RECT),
     ]
 
+@functools.lru_cache(maxsize=1)
 def _get_project_root():
-    """获取项目根目录"""
+    """获取项目根目录
+
+    运行期间不会变化，缓存结果省掉重复的 Path.resolve()
+    （Windows 上每次都是一趟完整路径 + 符号链接解析）。
+    """
     if "__compiled__" in globals():
         return pathlib.Path(__file__).resolve().parent.parent.parent.parent
     elif getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
@@ -79,6 +167,34 @@ def _get_project_root():
         return pathlib.Path(sys.argv[0] if sys.argv[0] else __file__).resolve().parent
 
 
+class _TunedHTTPServer(http.server.ThreadingHTTPServer):
+    """本地静态服务专用的 TCP 服务器调优
+
+    - 复用地址：进程重启不再被 TIME_WAIT 挡住
+    - 加大 accept 队列：SPA 冷启动并发拉取资源时不丢连接
+    - 关闭 Nagle：localhost 小响应不吃延迟确认等待
+    - 连接处理提交到有界线程池，不再每个连接新建线程
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, *args, **kwargs):
+        self._pool = ThreadPoolExecutor(
+            max_workers=(os.cpu_count() or 4) * 2, thread_name_prefix="http-"
+        )
+        super().__init__(*args, **kwargs)
+
+    def process_request(self, request, client_address):
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+
 class StaticServer:
     """静态文件服务器 - 支持 SPA 路由回退"""
 
@@ -90,6 +206,9 @@ class StaticServer:
     DEFAULT_PORTS = [8080, 8081, 8082, 8083, 8084, 8085, 8086, 8087, 8088, 8089]
     PORT_RANGE = range(8000, 9000)
 
+    # 本进程内上次成功使用的端口，优先复用
+    _last_good_port = None
+
     def __new__(cls, directory):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -112,42 +231,52 @@ class StaticServer:
 
     @classmethod
     def is_port_available(cls, port: int) -> bool:
-        """检查端口是否可用"""
+        """检查端口是否可用
+
+        带 SO_REUSEADDR 并真正 listen：只 bind 不 listen 会把 TIME_WAIT
+        里的端口误判为占用，进程重启时平白跳过刚释放的端口。
+        """
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('', port))
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                s.bind(('127.0.0.1', port))
+                s.listen(1)
                 return True
-        except OSError:
+        except (OSError, OverflowError):
             return False
 
     @classmethod
-    def find_available_port(cls, preferred_ports=None, max_attempts=10) -> int:
+    def find_available_port(cls, preferred_ports=None) -> int:
         """查找可用端口
 
+        未给候选列表时先复用上次成功的端口，否则 bind 0 号端口让内核
+        分配：一次系统调用拿到必然空闲的端口，不再随机试探。候选列表
+        全部被占用时同样退回内核分配。
+
         Args:
             preferred_ports: 优先尝试的端口列表
-            max_attempts: 最大尝试次数
 
         Returns:
             可用的端口号
         """
-        if preferred_ports is None:
-            preferred_ports = cls.DEFAULT_PORTS
+        if preferred_ports is not None:
+            for port in preferred_ports:
+                if cls.is_port_available(port):
+                    cls._last_good_port = port
+                    return port
+            logger.warning(f"首选端口均被占用，改由系统分配: {preferred_ports}")
 
-        tried_ports = set()
+        last = cls._last_good_port
+        if last is not None and cls.is_port_available(last):
+            return last
 
-        for port in preferred_ports:
-            if port not in tried_ports and cls.is_port_available(port):
-                tried_ports.add(port)
-                return port
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
 
-        for _ in range(max_attempts):
-            port = random.randint(8000, 8999)
-            if port not in tried_ports and cls.is_port_available(port):
-                tried_ports.add(port)
-                return port
-
-        raise OSError(f"无法找到可用端口，已尝试: {tried_ports}")
+        cls._last_good_port = port
+        return port
 
     def start(self, port=0, max_retries=3):
         """启动服务器
@@ -159,22 +288,15 @@ class StaticServer:
         Returns:
             实际使用的端口号
         """
-        mimetypes.init()
-        mimetypes.add_type('application/javascript', '.js')
-        mimetypes.add_type('text/css', '.css')
-        mimetypes.add_type('application/json', '.json')
-        mimetypes.add_type('image/svg+xml', '.svg')
-        mimetypes.add_type('application/wasm', '.wasm')
-
-        os.chdir(self.directory)
-
         actual_port = port
         retry_count = 0
 
         while retry_count < max_retries:
             try:
                 if port == 0:
-                    actual_port = self.find_available_port()
+                    # 直接把 0 号端口交给内核分配：单次 bind 即拿到端口，
+                    # 没有“探测可用后再绑定”之间被抢占的竞态窗口
+                    actual_port = 0
                 elif port == -1:
                     actual_port = self.find_available_port(self.DEFAULT_PORTS)
                 elif not self.is_port_available(port):
@@ -182,10 +304,14 @@ class StaticServer:
                     actual_port = self.find_available_port()
                     port = actual_port
 
-                self._server = socketserver.ThreadingTCPServer(
-                    ("", actual_port), self._create_handler()
+                # 只绑回环地址：桌面 webview 是唯一消费者，不暴露到局域网，
+                # 也避免首次运行弹防火墙授权
+                self._server = _TunedHTTPServer(
+                    ("127.0.0.1", actual_port), self._create_handler()
                 )
+                actual_port = self._server.server_address[1]
                 self._port = actual_port
+                StaticServer._last_good_port = actual_port
                 logger.info(f"静态服务器启动: http://localhost:{actual_port}")
                 break
             except OSError as e:
@@ -206,50 +332,187 @@ class StaticServer:
 
         return actual_port
     
+    # 资源缓存上限：条目数与单文件体积，超限的文件退回基类的流式路径
+    MAX_CACHED_FILES = 512
+    MAX_CACHED_BODY = 2 * 1024 * 1024
+
+    def _build_url_map(self):
+        """枚举静态目录与项目级资源，建立 URL 路径 -> 绝对路径映射
+
+        目录内容在服务器生命周期内固定，启动时枚举一次后所有请求
+        （含 /font/ 与 /logo.png 特例）都走 O(1) 字典查找，不再逐请求
+        stat 探测。先登记项目级资源，保持其优先于静态目录同名文件。
+        """
+        project_root = _get_project_root()
+        url_map = {}
+
+        logo = project_root / 'logo.png'
+        if logo.is_file():
+            url_map['/logo.png'] = str(logo)
+
+        for base, prefix in ((project_root / 'font', '/font'), (pathlib.Path(self.directory), '')):
+            if not base.is_dir():
+                continue
+            for dirpath, _dirnames, filenames in os.walk(base):
+                dir_path = pathlib.Path(dirpath)
+                for filename in filenames:
+                    full = dir_path / filename
+                    url = prefix + '/' + full.relative_to(base).as_posix()
+                    url_map.setdefault(url, str(full))
+
+        return url_map
+
     def _create_handler(self):
         """创建请求处理器"""
         directory = self.directory
-        project_root = _get_project_root()
-        
+
+        # URL 路径 -> 绝对文件系统路径，启动时枚举一次
+        url_map = self._build_url_map()
+        # 已知文件的 Content-Type 一并预判好，请求路径上纯字典取值
+        mime_map = {
+            fs_path: mimetypes.guess_type(fs_path)[0] or 'application/octet-stream'
+            for fs_path in url_map.values()
+        }
+        # 文件系统路径 -> (body, content_type, etag, 预压缩变体)：首次 GET 时
+        # 整体读入内存，之后命中零磁盘系统调用，一次 write 发完
+        body_cache = {}
+        max_files = self.MAX_CACHED_FILES
+        max_body = self.MAX_CACHED_BODY
+        # 日志开关只在建服时判定一次：生产运行下 log_message 直接返回，
+        # 不再每个请求都格式化一遍丢弃的字符串
+        dbg_enabled = logger.isEnabledFor(logging.DEBUG)
+
         class SPAHandler(http.server.SimpleHTTPRequestHandler):
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, directory=directory, **kwargs)
-            
+
+            @staticmethod
+            def _cache_control(path):
+                """按 URL 给出缓存策略：指纹资源长缓存，入口页每次协商校验"""
+                if path == '/index.html':
+                    return 'no-cache'
+                if _HASHED_ASSET_RE.search(path):
+                    return 'public, max-age=31536000, immutable'
+                return 'public, max-age=3600'
+
+            def _cached_entry(self, file_path):
+                """读取并缓存文件内容；过大或读取失败返回 None"""
+                entry = body_cache.get(file_path)
+                if entry is not None:
+                    return entry
+                if len(body_cache) >= max_files:
+                    return None
+                try:
+                    body = pathlib.Path(file_path).read_bytes()
+                except OSError:
+                    return None
+                if len(body) > max_body:
+                    return None
+                content_type = self.guess_type(file_path)
+                etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+                # 文本类资源只在首次进缓存时压缩一次，此后按协商直接发送；
+                # 压不小的变体不保留
+                encoded = {}
+                if content_type and content_type.startswith(_COMPRESSIBLE_TYPES):
+                    gz = gzip.compress(body, 9)
+                    if len(gz) < len(body):
+                        encoded['gzip'] = gz
+                    if brotli is not None:
+                        br = brotli.compress(body, quality=11)
+                        if len(br) < len(body):
+                            encoded['br'] = br
+
+                entry = (body, content_type, etag, encoded)
+                body_cache[file_path] = entry
+                return entry
+
             def do_GET(self):
                 """处理 GET 请求，支持 SPA 路由回退和字体文件"""
                 path = self.path
                 if path == '/':
                     path = '/index.html'
-                
+
                 if '?' in path:
                     path = path.split('?')[0]
-                
-                file_path = self.translate_path(path)
-                
-                if not os.path.exists(file_path):
-                    if path.startswith('/font/'):
-                        font_path = project_root / path[1:]
-                        if font_path.exists():
-                            self.path = path
-                            return super().do_GET()
-                    logger.debug(f"文件不存在，回退到 index.html: {path}")
-                    self.path = '/index.html'
-                
-                return super().do_GET()
-            
+
+                file_path = url_map.get(path)
+                if file_path is None:
+                    logger.debug("文件不存在，回退到 index.html: %s", path)
+                    path = '/index.html'
+                    file_path = url_map.get(path) or self.translate_path(path)
+
+                entry = self._cached_entry(file_path)
+                if entry is None:
+                    # 大文件或读取失败，回到基类的 open/stat/copyfileobj 实现
+                    self.path = path
+                    return super().do_GET()
+
+                body, content_type, etag, encoded = entry
+
+                # 条件请求命中强 ETag 直接 304，不传输正文
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Cache-Control', self._cache_control(path))
+                    self.end_headers()
+                    return
+
+                # 按 Accept-Encoding 协商：br > gzip > 原始字节
+                encoding = None
+                if encoded:
+                    accept = self.headers.get('Accept-Encoding', '')
+                    for name in ('br', 'gzip'):
+                        if name in encoded and name in accept:
+                            encoding = name
+                            body = encoded[name]
+                            break
+
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', self._cache_control(path))
+                if encoded:
+                    self.send_header('Vary', 'Accept-Encoding')
+                if encoding:
+                    self.send_header('Content-Encoding', encoding)
+                self.end_headers()
+                self.wfile.write(body)
+
             def translate_path(self, path):
-                if path.startswith('/font/'):
-                    font_path = project_root / path[1:]
-                    if font_path.exists():
-                        return str(font_path)
-                if path == '/logo.png':
-                    logo_path = project_root / 'logo.png'
-                    if logo_path.exists():
-                        return str(logo_path)
+                mapped = url_map.get(path)
+                if mapped is not None:
+                    return mapped
                 return super().translate_path(path)
+
+            def guess_type(self, path):
+                ctype = mime_map.get(path)
+                if ctype is not None:
+                    return ctype
+                return super().guess_type(path)
+
+            def copyfile(self, source, outputfile):
+                """大文件正文走内核侧 sendfile 零拷贝发送
+
+                只有超出内存缓存上限的资源会走到这里；响应头还缓冲在
+                wfile 里，先 flush 再把文件交给内核。没有文件描述符的
+                源（回退的 io 对象）仍用基类的分块复制。
+                """
+                try:
+                    source.fileno()
+                except (OSError, AttributeError, ValueError):
+                    return super().copyfile(source, outputfile)
+
+                self.wfile.flush()
+                try:
+                    self.connection.sendfile(source)
+                except (OSError, ValueError):
+                    super().copyfile(source, outputfile)
             
             def log_message(self, format, *args):
-                logger.debug(f"[HTTP] {args[0]}")
+                if dbg_enabled:
+                    logger.debug("[HTTP] %s", args[0] if args else format)
         
         return SPAHandler
     
@@ -267,30 +530,40 @@ class MainWindow:
 
     def __init__(self):
         self.project_root = _get_project_root()
-        
-        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-            self.dll_dir = str(self.project_root / "dll")
-            self.font_dir = str(self.project_root / "font")
-            self.dll_path = str(self.project_root / "dll" / "mb132_x64.dll")
-            self.html_dir = str(self.project_root / "html")
-            self.html_path = str(self.project_root / "html" / "index.html")
-        else:
-            self.dll_dir = str(self.project_root / "dll")
-            self.dll_path = str(self.project_root / "dll" / "mb132_x64.dll")
-            self.font_dir = str(self.project_root / "font")
-            self.html_dir = str(self.project_root / "html")
-            self.html_path = str(self.project_root / "html" / "index.html")
+
+        # 冻结与源码运行的目录布局相同（差异都在 _get_project_root 里），
+        # 这里不再按 frozen 分支重复一遍同样的赋值
+        dll_dir = self.project_root / "dll"
+        html_dir = self.project_root / "html"
+        self.dll_dir = str(dll_dir)
+        self.dll_path = str(dll_dir / "mb132_x64.dll")
+        self.font_dir = str(self.project_root / "font")
+        self.html_dir = str(html_dir)
+        self.html_path = str(html_dir / "index.html")
         self.lib = None
+        self._engine_inited = False
         self.webview = None
         self.hwnd = None
         self.running = True
         self.title = "Cellium Serial"
         
-        self._wnd_proc = None
         self._wnd_class = None
+
+        # 消息号 -> 处理函数：窗口过程收到的每条消息都经此分发，
+        # 字典取值保持 O(1)，新增消息处理不再加长 if 链
+        self._msg_handlers = {WM_CLOSE: self._on_wm_close}
+
+        # WNDPROC thunk 只构造这一次并常驻实例；子类化窗口时传
+        # ctypes.cast(self._wnd_proc, ctypes.c_void_p).value
+        self._wnd_proc = _WNDPROC_TYPE(self._window_procedure)
+
+        self._fade_out_subscribed = False
         
         self.bridge = None
         self.app_icon = None
+        # 图标的磁盘读取在后台先行，窗口创建路径不等这笔 I/O
+        self._icon_thread = threading.Thread(target=self._preload_icon, daemon=True)
+        self._icon_thread.start()
         
         self.calculator = None
         self.message_handler = None
@@ -298,6 +571,11 @@ class MainWindow:
         # 静态文件服务器
         self._static_server = None
         self._html_url = None
+        # 预编码的 URL 字节与索引页字节：编码/读盘一次，之后每次
+        # 加载直接复用
+        self._html_url_bytes = None
+        self._base_url_bytes = None
+        self._index_html_bytes = None
     
     def _get_component(self, component_type):
         """从 DI 容器获取组件
@@ -316,24 +594,37 @@ class MainWindow:
             logger.warning(f"获取组件失败 {component_type.__name__}: {e}")
         return None
     
-    def load_window_icon(self):
-        """加载并设置窗口图标"""
+    def _icon_path(self):
+        """图标文件路径"""
+        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+            return os.path.join(self.dll_dir, "app_icon.ico")
+        return os.path.join(self.project_root, "app_icon.ico")
+
+    def _preload_icon(self):
+        """后台预加载窗口图标
+
+        LoadImageW 的磁盘读取从窗口创建关键路径挪到 __init__ 启动的
+        后台线程；load_window_icon 只负责把加载好的句柄发给窗口。
+        """
         try:
-            if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-                icon_path = os.path.join(self.dll_dir, "app_icon.ico")
-            else:
-                icon_path = os.path.join(self.project_root, "app_icon.ico")
-            
+            icon_path = self._icon_path()
             if os.path.exists(icon_path):
                 self.app_icon = user32.LoadImageW(None, icon_path, 1, 32, 32, 16)
-                if self.app_icon:
-                    user32.SendMessageW(self.hwnd, 0x80, 1, self.app_icon)
-                    user32.SendMessageW(self.hwnd, 0x80, 0, self.app_icon)
-                    logger.info(f"窗口图标已设置: {icon_path}")
-                else:
+                if not self.app_icon:
                     logger.warning(f"加载图标失败，错误码: {kernel32.GetLastError()}")
             else:
                 logger.warning(f"图标文件不存在: {icon_path}")
+        except Exception as e:
+            logger.error(f"预加载图标失败: {e}")
+
+    def load_window_icon(self):
+        """设置窗口图标（图标已在后台预加载）"""
+        try:
+            self._icon_thread.join(timeout=2)
+            if self.app_icon:
+                user32.SendMessageW(self.hwnd, 0x80, 1, self.app_icon)
+                user32.SendMessageW(self.hwnd, 0x80, 0, self.app_icon)
+                logger.info("窗口图标已设置")
         except Exception as e:
             logger.error(f"设置窗口图标失败: {e}")
     
@@ -349,6 +640,8 @@ class MainWindow:
         self._static_server = StaticServer.get_instance(self.html_dir)
         actual_port = self._static_server.start(port=port)
         self._html_url = f"http://localhost:{actual_port}/index.html"
+        self._html_url_bytes = self._html_url.encode('utf-8')
+        self._base_url_bytes = f"http://localhost:{actual_port}/".encode('utf-8')
         logger.info(f"静态服务器 URL: {self._html_url}")
         return actual_port
     
@@ -360,22 +653,18 @@ class MainWindow:
         
         try:
             # 使用 wkeLoadURL 加载本地服务器 URL
-            if hasattr(self.lib, 'wkeLoadURL'):
-                self.lib.wkeLoadURL(self.webview, self._html_url.encode('utf-8'))
+            if self._wkeLoadURL is not None:
+                self._wkeLoadURL(self.webview, self._html_url_bytes)
                 logger.info(f"已加载 URL: {self._html_url}")
                 return True
             else:
                 # 回退到 mbLoadHtmlWithBaseUrl
-                html_path = os.path.join(self.html_dir, 'index.html')
-                with open(html_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                base_url = self._html_url.replace('/index.html', '/')
-                self.lib.mbLoadHtmlWithBaseUrl(
-                    self.webview, 
-                    html_content.encode('utf-8'), 
-                    base_url.encode('utf-8')
+                self._mbLoadHtmlWithBaseUrl(
+                    self.webview,
+                    self._load_index_bytes(),
+                    self._base_url_bytes
                 )
-                logger.info(f"已加载 HTML (fallback): {base_url}")
+                logger.info("已加载 HTML (fallback): %s", self._base_url_bytes)
                 return True
         except Exception as e:
             logger.error(f"加载 HTML 失败: {e}")
@@ -383,21 +672,26 @@ class MainWindow:
             traceback.print_exc()
             return False
     
+    def _on_wm_close(self, hwnd, wparam, lparam):
+        """处理 WM_CLOSE：淡出并停止应用程序"""
+        logger.info("收到 WM_CLOSE，停止应用程序...")
+        self.fade_out(duration=300)
+        self.running = False
+        # 停止静态服务器
+        if self._static_server:
+            self._static_server.stop()
+        try:
+            self._mbDestroyWebWindow(self.webview)
+        except:
+            pass
+        user32.PostQuitMessage(0)
+        return 0
+
     def _window_procedure(self, hwnd, msg, wparam, lparam):
-        """窗口过程 - 处理关闭消息"""
-        if msg == WM_CLOSE:
-            logger.info("收到 WM_CLOSE，停止应用程序...")
-            self.fade_out(duration=300)
-            self.running = False
-            # 停止静态服务器
-            if self._static_server:
-                self._static_server.stop()
-            try:
-                self.lib.mbDestroyWebWindow(self.webview)
-            except:
-                pass
-            user32.PostQuitMessage(0)
-            return 0
+        """窗口过程 - 按消息号字典分发"""
+        handler = self._msg_handlers.get(msg)
+        if handler is not None:
+            return handler(hwnd, wparam, lparam)
         return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
         
     def _init_dll_functions(self):
@@ -422,16 +716,31 @@ class MainWindow:
             'mbOnJsQuery': ([ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p], None),
         }
         
+        # 解析出的函数同时绑到 self（self._mbXxx）：ctypes 的
+        # dll.name 属性查找每次都要走 __getattr__，热路径直呼
+        # 预绑定的 _FuncPtr 省掉这层解析；缺失的符号绑为 None
+        for name in functions:
+            setattr(self, '_' + name, None)
+
+        # hasattr 探测代替 try/except AttributeError：缺失符号不再走
+        # Python 异常机制；命中后的 getattr 直接取 ctypes 缓存的 _FuncPtr
+        lib = self.lib
         for name, (argtypes, restype) in functions.items():
-            try:
-                func = getattr(self.lib, name)
-                func.argtypes = argtypes
-                if restype:
-                    func.restype = restype
-            except AttributeError:
-                pass
+            if not hasattr(lib, name):
+                continue
+            func = getattr(lib, name)
+            func.argtypes = argtypes
+            if restype:
+                func.restype = restype
+            setattr(self, '_' + name, func)
+
+        # wkeLoadURL 不在原型表里（wke 系导出），一并预绑定
+        self._wkeLoadURL = getattr(self.lib, 'wkeLoadURL', None)
     
     def load_dll(self):
+        if self.lib is not None:
+            return True
+
         if not os.path.exists(self.dll_path):
             logger.error(f"未找到 DLL: {self.dll_path}")
             return False
@@ -446,17 +755,21 @@ class MainWindow:
             return False
     
     def init_engine(self):
+        # mbInit 不可重入（会重复分配引擎线程池），只初始化一次
+        if self._engine_inited:
+            return True
+
         try:
-            mbInit = self.lib.mbInit
-            mbInit.argtypes = [ctypes.c_void_p]
-            mbInit(None)
-            
+            # argtypes 与预绑定都在 _init_dll_functions 做过，直接调用
+            self._mbInit(None)
+
             if hasattr(self.lib, 'mbEnableHighDPISupport'):
                 self.lib.mbEnableHighDPISupport()
                 logger.info("高 DPI 支持已启用")
             else:
                 logger.debug("mbEnableHighDPISupport 函数不可用")
 
+            self._engine_inited = True
             logger.info("引擎已初始化")
             return True
         except Exception as e:
@@ -466,15 +779,18 @@ class MainWindow:
             return False
     
     def create_window(self):
+        if self.webview:
+            return True
+
         try:
-            self.webview = self.lib.mbCreateWebWindow(
+            self.webview = self._mbCreateWebWindow(
                 0, None, 100, 100, 1024, 768
             )
             if not self.webview:
                 logger.error("[ERROR] 创建窗口失败")
                 return False
             
-            self.hwnd = self.lib.mbGetHostHWND(self.webview)
+            self.hwnd = self._mbGetHostHWND(self.webview)
             
             if self.hwnd:
                 user32.SetWindowTextW(self.hwnd, "Cellium Serial")
@@ -495,7 +811,6 @@ class MainWindow:
                 if owner:
                     user32.SetWindowLongPtrW(self.hwnd, GWL_HWNDPARENT, None)
                 
-                shell32 = ctypes.windll.shell32
                 try:
                     shell32.SetCurrentProcessExplicitAppUserModelIDW("Cellium.Serial")
                     logger.info("AppUserModelID 已设置")
@@ -530,18 +845,33 @@ class MainWindow:
         """
         if not self.hwnd:
             return
-        
-        steps = 20
-        step_duration = duration / steps
-        
-        for i in range(steps):
-            alpha = 255 - int((255 / steps) * (i + 1))
-            if alpha < 0:
-                alpha = 0
-            
-            user32.SetLayeredWindowAttributes(self.hwnd, 0, alpha, LWA_ALPHA)
-            time.sleep(step_duration / 1000.0)
-        
+
+        # 首选 AnimateWindow：混合淡出由系统完成，一次 FFI 调用替代
+        # 整个插值循环。分层窗口或系统禁用窗口动画时返回 FALSE，
+        # 退回下面的手动插值
+        if user32.AnimateWindow(self.hwnd, int(duration), AW_HIDE | AW_BLEND):
+            logger.info("[INFO] 淡出动画完成")
+            return
+
+        # Windows 默认定时器粒度约 15.6ms，固定 20 步 sleep 会把 300ms
+        # 拖长且步进抖动；动画期间临时把系统定时器调到 1ms，并按实际
+        # 流逝时间推 alpha，总时长精确、帧间均匀
+        winmm.timeBeginPeriod(1)
+        try:
+            set_alpha = user32.SetLayeredWindowAttributes
+            hwnd = self.hwnd
+            total = duration / 1000.0
+            start = time.perf_counter()
+            while True:
+                elapsed = time.perf_counter() - start
+                if elapsed >= total:
+                    break
+                set_alpha(hwnd, 0, int(255 * (1.0 - elapsed / total)), LWA_ALPHA)
+                time.sleep(0.016)
+            set_alpha(hwnd, 0, 0, LWA_ALPHA)
+        finally:
+            winmm.timeEndPeriod(1)
+
         logger.info("[INFO] 淡出动画完成")
     
     def _on_fade_out(self, event: FadeOutEvent):
@@ -553,23 +883,28 @@ class MainWindow:
         if self._static_server:
             self._static_server.stop()
         try:
-            self.lib.mbDestroyWebWindow(self.webview)
+            self._mbDestroyWebWindow(self.webview)
         except:
             pass
         user32.PostQuitMessage(0)
     
+    def _load_index_bytes(self):
+        """读取索引页字节并缓存；页面在进程生命周期内不变，只读一次"""
+        if self._index_html_bytes is None:
+            self._index_html_bytes = pathlib.Path(self.html_path).read_bytes()
+        return self._index_html_bytes
+
     def load_html_with_buttons(self):
         """加载包含计算器和标题栏的 HTML 页面 - Google 风格"""
         try:
-            with open(self.html_path, 'r', encoding='utf-8') as f:
-                html = f.read()
+            html = self._load_index_bytes()
             logger.info("HTML 按钮已加载")
         except Exception as e:
             logger.error(f"加载 HTML 文件失败: {e}")
             return False
-        
+
         try:
-            self.lib.mbLoadHtmlWithBaseUrl(self.webview, html.encode('utf-8'), b"about:blank")
+            self._mbLoadHtmlWithBaseUrl(self.webview, html, b"about:blank")
             return True
         except Exception as e:
             logger.error(f"加载 HTML 到 MiniBlink 失败: {e}")
@@ -579,20 +914,25 @@ class MainWindow:
         logger.info("启动消息循环...")
         try:
             msg = wintypes.MSG()
+            msg_ref = byref(msg)
+            wait_for_input = user32.MsgWaitForMultipleObjectsEx
+            peek = user32.PeekMessageW
+            translate = user32.TranslateMessage
+            dispatch = user32.DispatchMessageW
+
             while self.running:
-                ret = user32.GetMessageW(byref(msg), None, 0, 0)
-                if ret == 0:
-                    break
-                elif ret == -1:
-                    logger.error("GetMessageW 错误")
-                    break
-                user32.TranslateMessage(byref(msg))
-                user32.DispatchMessageW(byref(msg))
-                
-                if self.hwnd:
-                    if not user32.IsWindow(self.hwnd):
-                        logger.info("窗口已关闭，退出...")
+                # 阻塞等输入，到达后用 PeekMessageW 一口气排空整批消息：
+                # 拖动/移动风暴时每批只付一次阻塞等待。退出由关闭路径
+                # （FADE_OUT 事件处理器 _on_fade_out）置 running=False 并
+                # PostQuitMessage 发出 WM_QUIT 驱动，不再每条消息额外调
+                # 一次 IsWindow
+                wait_for_input(0, None, INFINITE, QS_ALLINPUT, MWMO_INPUTAVAILABLE)
+                while peek(msg_ref, None, 0, 0, PM_REMOVE):
+                    if msg.message == WM_QUIT:
+                        self.running = False
                         break
+                    translate(msg_ref)
+                    dispatch(msg_ref)
         except Exception as e:
             logger.error(f"消息循环错误: {e}")
         logger.info("消息循环已退出")
@@ -620,28 +960,36 @@ class MainWindow:
             logger.error(f"移除标题栏失败: {e}")
     
     def run(self):
+        # 静态服务器的 bind + 线程启动放到后台，与回调注册/窗口样式
+        # 调整并行；self.lib 仍只在主线程触碰
+        server_thread = threading.Thread(target=self.start_static_server, daemon=True)
+        server_thread.start()
+
         # 初始化消息处理器组件
         self.message_handler = MessageHandler(self.hwnd, None)
-        
-        # 订阅事件
-        event_bus.subscribe(EventType.FADE_OUT, self._on_fade_out)
-        
+
+        # 订阅事件（只订阅一次，重复进入 run() 不再走总线的去重扫描）
+        if not self._fade_out_subscribed:
+            event_bus.subscribe(EventType.FADE_OUT, self._on_fade_out)
+            self._fade_out_subscribed = True
+
         # 设置所有回调
         self.bridge.setup_all_callbacks()
-        
-        # 启动静态文件服务器并加载 HTML
-        self.start_static_server()
-        self.load_html_from_server()
+
         #系统原生标题栏，注释后启用
         self.remove_titlebar()
 
+        # 汇合：URL 就绪后再加载 HTML
+        server_thread.join()
+        self.load_html_from_server()
+
         user32.ShowWindow(self.hwnd, 1)
         user32.SetForegroundWindow(self.hwnd)
         
         
         try:
-            self.lib.mbShowWindow(self.webview, True)
-            self.lib.mbMoveToCenter(self.webview)
+            self._mbShowWindow(self.webview, True)
+            self._mbMoveToCenter(self.webview)
         except Exception as e:
             logger.error(f"显示窗口失败: {e}")
            